@@ -1,6 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
-import datetime
+from tkinter import messagebox
 from AgendaViewService_Class import AgendaViewService
 
 
@@ -19,6 +19,9 @@ class AgendaViewGUI:
         parent_gui (MonthViewGUI, optional): Reference to parent for refreshing
     """
 
+    # Every event is listed with its title, time and description
+    SHOWS_EVENT_DETAILS = True
+
     def __init__(self, calendar_obj, parent_gui=None):
         """
         Initialize the AgendaViewGUI.
@@ -207,9 +210,8 @@ class AgendaViewGUI:
         for event in all_events:
             # Format the date for display in DD-MM-YYYY format
             try:
-                # Parse the start date string (database format) and convert to DD-MM-YYYY
-                date_obj = datetime.datetime.strptime(event.start_day, "%Y-%m-%d")
-                formatted_date = date_obj.strftime("%b %d, %Y")  # Example: "Nov 02, 2024"
+                # Use the parsed start date and convert it for display
+                formatted_date = event.start_date.strftime("%b %d, %Y")  # Example: "Nov 02, 2024"
             except ValueError:
                 # If date parsing fails, just use the original date string
                 formatted_date = event.start_day
@@ -272,7 +274,7 @@ class AgendaViewGUI:
 
         # Check if user actually selected something
         if not selected_items:
-            tk.messagebox.showwarning("No Selection", "Please select an event to edit.")
+            messagebox.showwarning("No Selection", "Please select an event to edit.")
             return
 
         # Get the first selected item
@@ -283,14 +285,14 @@ class AgendaViewGUI:
 
         # Check if this is a valid event (not the "No events found" message)
         if not event_id:
-            tk.messagebox.showwarning("Invalid Selection", "Cannot edit this item.")
+            messagebox.showwarning("Invalid Selection", "Cannot edit this item.")
             return
 
         # Get the actual event object using the event_id
         event_obj = self.agenda_service.get_event_by_id(event_id)
 
         if not event_obj:
-            tk.messagebox.showerror("Error", "Event not found in calendar.")
+            messagebox.showerror("Error", "Event not found in calendar.")
             return
 
         # Import and create a DayViewGUI to handle the editing
@@ -298,8 +300,8 @@ class AgendaViewGUI:
         try:
             from DayViewGUI_Class import DayViewGUI
 
-            # Parse the event date to get year, month, day
-            date_obj = datetime.datetime.strptime(event_obj.start_day, "%Y-%m-%d")
+            # Use the event's start date to get year, month, day
+            date_obj = event_obj.start_date
 
             # Create a day view for this event's date
             # The day view has the event editing functionality we need
@@ -313,17 +315,20 @@ class AgendaViewGUI:
             )
 
             # Find the event in the day view's event list and trigger edit
-            day_view.refresh_events_list()
-            for i, day_event in enumerate(day_view.current_events):
-                if day_event.event_id == event_obj.event_id:
-                    # Found the matching event, open edit dialog
-                    day_view.event_form_dialog("Edit Event", i)
-                    break
+            # The day view loads its events in the background, so wait until they arrive
+            def open_edit_dialog():
+                for i, day_event in enumerate(day_view.current_events):
+                    if day_event.event_id == event_obj.event_id:
+                        # Found the matching event, open edit dialog
+                        day_view.event_form_dialog("Edit Event", i)
+                        break
+
+            day_view.refresh_events_list(on_loaded=open_edit_dialog)
 
         except ImportError:
-            tk.messagebox.showerror("Error", "Cannot import DayViewGUI class for editing.")
+            messagebox.showerror("Error", "Cannot import DayViewGUI class for editing.")
         except Exception as e:
-            tk.messagebox.showerror("Error", f"Failed to edit event: {str(e)}")
+            messagebox.showerror("Error", f"Failed to edit event: {str(e)}")
 
     def delete_selected_event(self):
         """Delete the selected event after confirmation."""
@@ -332,7 +337,7 @@ class AgendaViewGUI:
 
         # Check if user actually selected something
         if not selected_items:
-            tk.messagebox.showwarning("No Selection", "Please select an event to delete.")
+            messagebox.showwarning("No Selection", "Please select an event to delete.")
             return
 
         # Get the first selected item
@@ -343,21 +348,21 @@ class AgendaViewGUI:
 
         # Check if this is a valid event (not the "No events found" message)
         if not event_id:
-            tk.messagebox.showwarning("Invalid Selection", "Cannot delete this item.")
+            messagebox.showwarning("Invalid Selection", "Cannot delete this item.")
             return
 
         # Get the actual event object using the event_id
         event_obj = self.agenda_service.get_event_by_id(event_id)
 
         if not event_obj:
-            tk.messagebox.showerror("Error", "Event not found in calendar.")
+            messagebox.showerror("Error", "Event not found in calendar.")
             return
 
         # Check if it's a recurring event and ask about all occurrences
         delete_all = False
         if event_obj.is_recurring:
             # Ask user if they want to delete all instances
-            response = tk.messagebox.askyesnocancel(
+            response = messagebox.askyesnocancel(
                 "Delete Recurring Event",
                 f"'{event_obj.title}' is a recurring event ({event_obj.recurrence_pattern}).\n\n"
                 f"Yes = Delete ALL occurrences\n"
@@ -370,7 +375,7 @@ class AgendaViewGUI:
             delete_all = response  # True = delete all, False = delete single
         else:
             # Regular event confirmation
-            confirm = tk.messagebox.askyesno(
+            confirm = messagebox.askyesno(
                 "Confirm Delete",
                 f"Are you sure you want to delete the event '{event_obj.title}'?"
             )
@@ -391,10 +396,10 @@ class AgendaViewGUI:
                 self.parent_gui.refresh_calendar_display()
 
             # Show success message to user
-            tk.messagebox.showinfo("Success", message)
+            messagebox.showinfo("Success", message)
         else:
             # Show error message if deletion failed
-            tk.messagebox.showerror("Error", message)
+            messagebox.showerror("Error", message)
 
 
 class FilteredAgendaViewGUI(AgendaViewGUI):
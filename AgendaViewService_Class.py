@@ -36,46 +36,7 @@ class AgendaViewService:
         Returns:
             list: List of all Event objects sorted by date and time
         """
-        all_events = []
-        today = self.calendar_service.get_today()
-
-        # Get events from specified range
-        for month_offset in range(-months_before, months_after + 1):
-            # Calculate target month/year
-            target_year = today.year
-            target_month = today.month + month_offset
-
-            # Adjust for year boundaries
-            while target_month <= 0:
-                target_month += 12
-                target_year -= 1
-            while target_month > 12:
-                target_month -= 12
-                target_year += 1
-
-            # Get events for this month
-            month_events = self._get_events_for_month(target_year, target_month)
-            all_events.extend(month_events)
-
-        # Sort events by date and time
-        all_events.sort(key=lambda event: (event.date, event.start_time))
-
-        return all_events
-    
-    def _get_events_for_month(self, year, month):
-        """
-        Get all events for a specific month.
-        Internal helper method.
-
-        Args:
-            year (int): Year (e.g., 2025)
-            month (int): Month (1-12)
-
-        Returns:
-            List[Event]: All events in that month
-        """
-        event_dicts = self.calendar_service.repository.get_events_for_month(year, month)
-        return [self.calendar_service._dict_to_event(event_dict) for event_dict in event_dicts]
+        return self.calendar_service.get_events_around_today(months_before, months_after)
     
     def get_event_by_id(self, event_id):
         """
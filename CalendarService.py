@@ -19,14 +19,14 @@ View-specific operations have been moved to dedicated service classes:
 
 """
 
+import collections
 import datetime
-import calendar
+import Calendar_Math
 from Calendar_Database_Class import CalendarDatabase
 from Event_Class import Event
 from Filter_Service_Class import FilterService
 
 
-
 class CalendarService:
     """
     Unified service class that handles all calendar logic and operations.
@@ -160,6 +160,62 @@ class CalendarService:
         except Exception as e:
             return False, f"Error creating event: {str(e)}", None
 
+    def import_events(self, events):
+        """
+        Save a batch of existing Event objects, e.g. when restoring a backup.
+        All events are written in a single transaction. Imported events were
+        validated when they were first created, so they are not re-validated
+        (past events can be restored).
+
+        Args:
+            events (iterable): Event objects to save. Their event_id is ignored
+                               and a new one is assigned by the database.
+
+        Returns:
+            Tuple[bool, str, list]: (success, message, event_ids)
+        """
+        events_data = [event.to_dict() for event in events]
+        if not events_data:
+            return True, "No events to import", []
+
+        try:
+            event_ids = self.repository.insert_events(events_data)
+            return True, f"Imported {len(event_ids)} events!", event_ids
+        except Exception as e:
+            return False, f"Failed to import events: {str(e)}", []
+
+    def save_events(self, events):
+        """
+        Save a batch of Event objects in bulk, in a single transaction.
+        Events that already have an event_id are updated together with one
+        merged UPDATE per batch; the rest are inserted like import_events.
+        If any event cannot be saved, none of them is.
+        Like import_events, the events are not re-validated.
+
+        Args:
+            events (iterable): Event objects to save
+
+        Returns:
+            Tuple[bool, str, list]: (success, message, event_ids) where event_ids
+                                    follows the order of events and includes the
+                                    ids assigned to newly inserted events
+        """
+        events = list(events)
+        if not events:
+            return True, "No events to save", []
+
+        existing_data = [event.to_dict() for event in events if event.event_id is not None]
+        new_data = [event.to_dict() for event in events if event.event_id is None]
+
+        try:
+            new_ids = iter(self.repository.save_events(existing_data, new_data))
+        except Exception as e:
+            return False, f"Failed to save events: {str(e)}", []
+
+        event_ids = [event.event_id if event.event_id is not None else next(new_ids)
+                     for event in events]
+        return True, f"Saved {len(event_ids)} events!", event_ids
+
     def _create_recurring_events(self, title, start_date, start_time, end_time,
                                  description, is_all_day, recurrence_pattern,
                                  num_occurrences=30):
@@ -179,13 +235,13 @@ class CalendarService:
         Returns:
             list: List of created event IDs
         """
-        event_ids = []
+        events_data = []
         current_date = start_date
 
         for i in range(num_occurrences):
             date_str = current_date.strftime(self.DATABASE_DATE_FORMAT)
             
-            event_data = {
+            events_data.append({
                 'title': title,
                 'date': date_str,
                 'start_day': date_str,
@@ -196,13 +252,7 @@ class CalendarService:
                 'is_recurring': True,
                 'recurrence_pattern': recurrence_pattern,
                 'is_all_day': is_all_day
-            }
-
-            try:
-                event_id = self.repository.insert_event(event_data)
-                event_ids.append(event_id)
-            except Exception as e:
-                print(f"Warning: Failed to create occurrence on {date_str}: {e}")
+            })
 
             # Calculate next occurrence date
             if recurrence_pattern == 'daily':
@@ -223,7 +273,7 @@ class CalendarService:
                     current_date = current_date.replace(year=year, month=month)
                 except ValueError:
                     # Day doesn't exist in target month, use last day of month
-                    last_day = calendar.monthrange(year, month)[1]
+                    last_day = Calendar_Math.days_in_month(year, month)
                     current_date = current_date.replace(year=year, month=month, day=last_day)
             elif recurrence_pattern == 'yearly':
                 # Add one year
@@ -233,7 +283,12 @@ class CalendarService:
                     # Handle Feb 29 on non-leap years
                     current_date = current_date.replace(year=current_date.year + 1, day=28)
 
-        return event_ids
+        # Save the whole series in one transaction
+        try:
+            return self.repository.insert_events(events_data)
+        except Exception as e:
+            print(f"Warning: Failed to create recurring events: {e}")
+            return []
 
 
 
@@ -294,7 +349,11 @@ class CalendarService:
             event_dict['recurrence_pattern'] = recurrence_pattern
 
         # Validate the updated data
-        date_obj = datetime.datetime.strptime(event_dict['date'], self.DATABASE_DATE_FORMAT).date()
+        # Use the date we were given rather than parsing back the string just built from it
+        if date is not None:
+            date_obj = date
+        else:
+            date_obj = datetime.date.fromisoformat(event_dict['date'])
         is_valid, error_message = self._validate_event_data(
             event_dict['title'], date_obj,
             event_dict['start_time'], event_dict['end_time'],
@@ -323,12 +382,18 @@ class CalendarService:
             Tuple[bool, str]: (success, message)
         """
         try:
+            if not delete_all_recurring:
+                # A single delete needs no lookup first; the repository
+                # raises ValueError if the event does not exist
+                self.repository.delete_event(event_id)
+                return True, "Event deleted successfully!"
+
             # Check if event is recurring
             event_dict = self.repository.get_event_by_id(event_id)
             if not event_dict:
                 return False, "Event not found"
 
-            if event_dict['is_recurring'] and delete_all_recurring:
+            if event_dict['is_recurring']:
                 # Delete all instances of this recurring event
                 deleted_count = self.repository.delete_recurring_instances(
                     event_dict['title'],
@@ -392,7 +457,7 @@ class CalendarService:
             Tuple[bool, str]: (is_valid, error_message)
         """
         # Check title
-        if not title or not title.strip():
+        if not title or title.isspace():
             return False, "Event title is required and cannot be empty"
 
         # Check description length (80 character limit)
@@ -406,9 +471,9 @@ class CalendarService:
 
         # For timed events, check that times are provided
         if not is_all_day:
-            if not start_time or not start_time.strip():
+            if not start_time or start_time.isspace():
                 return False, "Start time is required for timed events"
-            if not end_time or not end_time.strip():
+            if not end_time or end_time.isspace():
                 return False, "End time is required for timed events"
 
         return True, ""
@@ -434,8 +499,8 @@ class CalendarService:
         today_str = today.strftime(self.DATABASE_DATE_FORMAT)
         
         # Get events from past months (going back 12 months to catch any past events)
-        deleted_count = 0
-        for month_offset in range(-12, 0):  # Check 12 months back
+        past_event_ids = []
+        for month_offset in range(-12, 1):  # Check 12 months back plus the current month
             target_year = today.year
             target_month = today.month + month_offset
             
@@ -444,31 +509,78 @@ class CalendarService:
                 target_month += 12
                 target_year -= 1
             
-            # Get events for this past month
+            # Get events for this month
             event_dicts = self.repository.get_events_for_month(target_year, target_month)
             
             for event_dict in event_dicts:
                 # Check if the event's end date is before today
                 end_day_str = event_dict.get('end_day', event_dict.get('date'))
                 if end_day_str and end_day_str < today_str:
-                    # Event has completely passed, delete it
+                    # Event has completely passed, mark it for deletion
                     event_id = event_dict.get('event_id')
                     if event_id:
-                        self.repository.delete_event(event_id)
-                        deleted_count += 1
+                        past_event_ids.append(event_id)
         
-        # Also check current month for any past events
-        event_dicts = self.repository.get_events_for_month(today.year, today.month)
-        for event_dict in event_dicts:
-            end_day_str = event_dict.get('end_day', event_dict.get('date'))
-            if end_day_str and end_day_str < today_str:
-                event_id = event_dict.get('event_id')
-                if event_id:
-                    self.repository.delete_event(event_id)
-                    deleted_count += 1
+        # Multi-day events can appear in several months, so delete each id once
+        deleted_count = self.repository.delete_events(dict.fromkeys(past_event_ids))
         
         return deleted_count
 
+    def get_events_around_today(self, months_before=6, months_after=6):
+        """
+        Get all events within a window of whole months relative to today.
+        The window is loaded with a single range query, so each event
+        appears once even if it spans several months.
+
+        Args:
+            months_before (int): Number of months before today to include
+            months_after (int): Number of months after today to include
+
+        Returns:
+            list: List of all Event objects sorted by date and time
+        """
+        today = self.get_today()
+
+        # Count months from year 0 so the offsets handle year boundaries
+        month_index = today.year * 12 + today.month - 1
+        first_year, first_month = divmod(month_index - months_before, 12)
+        last_year, last_month = divmod(month_index + months_after, 12)
+        first_day = datetime.date(first_year, first_month + 1, 1)
+        last_day = datetime.date(last_year, last_month + 1, Calendar_Math.days_in_month(last_year, last_month + 1))
+
+        # Rows come back ordered by date and start time
+        event_dicts = self.repository.get_events_for_date_range(
+            first_day.strftime(self.DATABASE_DATE_FORMAT),
+            last_day.strftime(self.DATABASE_DATE_FORMAT)
+        )
+        return [self._dict_to_event(event_dict) for event_dict in event_dicts]
+
+    # === GROUPING UTILITIES ===
+
+    def group_events_by_date(self, events, first_day, last_day):
+        """
+        Group events by the dates they occur on within a date range.
+        Multi-day events are listed under every day they cover in the range.
+
+        Args:
+            events (list): List of Event objects
+            first_day (datetime.date): First date of the range
+            last_day (datetime.date): Last date of the range
+
+        Returns:
+            dict: Maps datetime.date to the list of Event objects on that date
+        """
+        # defaultdict avoids building a throwaway list for every setdefault call
+        events_by_date = collections.defaultdict(list)
+        for event in events:
+            start_ordinal = max(event.start_date, first_day).toordinal()
+            end_ordinal = min(event.end_date, last_day).toordinal()
+            for ordinal in range(start_ordinal, end_ordinal + 1):
+                events_by_date[datetime.date.fromordinal(ordinal)].append(event)
+
+        # Return a plain dict so lookups of empty days don't insert new keys
+        return dict(events_by_date)
+
     # === FILTERING UTILITIES ===
 
     def filter_events(self, events, filter_criteria):
@@ -13,7 +13,11 @@ This class handles:
 """
 
 import sqlite3
-import calendar
+import threading
+import pathlib
+from collections import OrderedDict
+
+import Calendar_Math
 
 
 class CalendarDatabase:
@@ -24,6 +28,77 @@ class CalendarDatabase:
     a SQLite database file.
     """
 
+    # Stored in PRAGMA user_version once _create_tables has built the schema
+    SCHEMA_VERSION = 2
+    # Writable event columns, in the order produced by _event_to_row
+    EVENT_COLUMNS = ('title', 'description', 'date', 'start_day', 'end_day',
+                     'start_time', 'end_time', 'is_all_day', 'is_recurring',
+                     'recurrence_pattern')
+    # SQL statements are built once here so every call passes the same
+    # string and hits the connection's prepared statement cache
+    SELECT_EVENTS_SQL = '''
+        SELECT event_id, title, description, date, start_day, end_day,
+               start_time, end_time, is_all_day, is_recurring, recurrence_pattern
+        FROM events '''
+    GET_EVENT_BY_ID_SQL = SELECT_EVENTS_SQL + 'WHERE event_id = ?'
+    GET_EVENTS_FOR_MONTH_SQL = SELECT_EVENTS_SQL + '''
+        WHERE (date >= ? AND date < ?)
+           OR (start_day < ? AND end_day >= ?)
+        ORDER BY date, start_time'''
+    GET_EVENTS_FOR_DATE_SQL = SELECT_EVENTS_SQL + '''
+        WHERE ? BETWEEN start_day AND end_day
+        ORDER BY start_time'''
+    GET_EVENTS_FOR_DATE_RANGE_SQL = SELECT_EVENTS_SQL + '''
+        WHERE start_day <= ? AND end_day >= ?
+        ORDER BY date, start_time'''
+    GET_RECURRING_INSTANCES_SQL = SELECT_EVENTS_SQL + '''
+        WHERE title = ? 
+          AND is_recurring = 1 
+          AND recurrence_pattern = ?
+          AND date >= ?
+        ORDER BY date'''
+    HAS_EVENTS_ON_DATE_SQL = '''
+        SELECT 1 FROM events 
+        WHERE ? BETWEEN start_day AND end_day
+        LIMIT 1'''
+    UPDATE_EVENT_SQL = '''
+        UPDATE events SET 
+        title = :title, description = :description, date = :date,
+        start_day = :start_day, end_day = :end_day,
+        start_time = :start_time, end_time = :end_time, is_all_day = :is_all_day,
+        is_recurring = :is_recurring, recurrence_pattern = :recurrence_pattern,
+        modified_date = CURRENT_TIMESTAMP
+        WHERE event_id = :event_id'''
+    DELETE_EVENT_SQL = 'DELETE FROM events WHERE event_id = ?'
+    DELETE_RECURRING_INSTANCES_SQL = '''
+        DELETE FROM events 
+        WHERE title = ? 
+          AND is_recurring = 1 
+          AND recurrence_pattern = ?
+          AND date >= ?'''
+    INSERT_EVENTS_PREFIX_SQL = '''
+        INSERT INTO events 
+        (title, description, date, start_day, end_day, 
+         start_time, end_time, is_all_day, is_recurring, recurrence_pattern)
+        VALUES '''
+    EVENT_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    INSERT_EVENT_SQL = INSERT_EVENTS_PREFIX_SQL + '''(
+        :title, :description, :date, :start_day, :end_day,
+        :start_time, :end_time, :is_all_day, :is_recurring, :recurrence_pattern)'''
+    # Values used for the optional columns when an event dictionary leaves them out
+    EVENT_DEFAULTS = {'description': '', 'is_all_day': False,
+                      'is_recurring': False, 'recurrence_pattern': None}
+    # Maximum number of rows written by one INSERT statement in insert_events.
+    # 50 rows x 10 columns stays under SQLite's oldest bound-variable limit (999).
+    INSERT_BATCH_SIZE = 50
+    # Maximum number of events merged into one UPDATE in update_events_bulk.
+    # Each event binds 21 values (id + value for 10 columns, plus the IN list).
+    UPDATE_BATCH_SIZE = 40
+    # Maximum number of ids bound in one DELETE ... IN (...) in delete_events
+    DELETE_BATCH_SIZE = 500
+    # Number of month and date results kept by the read cache
+    QUERY_CACHE_SIZE = 64
+
     def __init__(self, db_name: str = 'calendar.db'):
         """
         Initialize the database connection and create tables if needed.
@@ -32,23 +107,82 @@ class CalendarDatabase:
             db_name (str): Name of the database file to use
         """
         self.db_name = db_name
-        # For in-memory databases, keep a persistent connection
-        self._persistent_conn = None
-        if db_name == ':memory:':
-            self._persistent_conn = sqlite3.connect(db_name)
+        # Keep one connection open for the lifetime of the object so SQLite's
+        # page cache and parsed schema are reused between queries
+        self._conn = sqlite3.connect(db_name, check_same_thread=False, cached_statements=256)
+        # Serializes access to the shared connection across threads
+        self._lock = threading.RLock()
+        # Recent get_events_for_month/get_events_for_date results, keyed by
+        # ('month', year, month) or ('date', date_str), oldest first
+        self._query_cache = OrderedDict()
+        # Bumped on every write so a read that raced a write is not cached
+        self._cache_generation = 0
+        self._configure_connection()
         self._create_tables()
+        self._open_read_connection()
+
+    def _open_read_connection(self):
+        """
+        Open a second, read-only connection used by the get_* queries.
+        With WAL journaling readers do not wait for a writer, so lookups keep
+        working while a save is in progress. In-memory databases cannot be
+        shared between connections and read through the main connection.
+        """
+        if self.db_name == ':memory:':
+            self._read_conn = self._conn
+            self._read_lock = self._lock
+            return
+
+        uri = pathlib.Path(self.db_name).resolve().as_uri() + '?mode=ro'
+        self._read_conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                          cached_statements=256)
+        self._read_conn.row_factory = sqlite3.Row
+        self._read_conn.executescript('''
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+            PRAGMA mmap_size=268435456;
+        ''')
+        # Serializes access to the read connection, independently of writes
+        self._read_lock = threading.RLock()
+
+    def _configure_connection(self):
+        """
+        Tune the connection for a small single-user database.
+        WAL journaling with synchronous=NORMAL avoids an fsync on every commit,
+        and the larger cache and memory-mapped I/O speed up reads.
+        """
+        with self._lock:
+            # Rows support lookup by column name, so no positional unpacking is needed
+            self._conn.row_factory = sqlite3.Row
+            # WAL does not apply to in-memory databases
+            if self.db_name != ':memory:':
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript('''
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA cache_size=-64000;
+                PRAGMA mmap_size=268435456;
+            ''')
 
     def _create_tables(self):
         """
         Create the database tables if they don't exist yet.
         This is called automatically when the repository is created.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Create events table - this stores all our event data
-            # event_id is now auto-incrementing primary key, just like CalendarDatabase
-            cursor.execute('''
+        with self._lock:
+            conn = self._get_connection()
+
+            # An existing database already has the tables and indexes
+            if conn.execute('PRAGMA user_version').fetchone()[0] >= self.SCHEMA_VERSION:
+                return
+
+            # Build the whole schema in one script and one transaction.
+            # event_id is an auto-incrementing primary key; the indexes cover
+            # the date lookups used by the calendar views and the search for
+            # the instances of a recurring series. user_version records that
+            # this schema is in place so later opens can skip the DDL.
+            conn.executescript(f'''
+                BEGIN;
                 CREATE TABLE IF NOT EXISTS events (
                     event_id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
@@ -63,47 +197,118 @@ class CalendarDatabase:
                     recurrence_pattern TEXT,
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     modified_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
+                );
+                CREATE INDEX IF NOT EXISTS idx_events_date ON events(date);
+                CREATE INDEX IF NOT EXISTS idx_events_span ON events(start_day, end_day);
+                CREATE INDEX IF NOT EXISTS idx_events_series
+                    ON events(title, recurrence_pattern, date) WHERE is_recurring = 1;
+                PRAGMA user_version = {self.SCHEMA_VERSION};
+                COMMIT;
             ''')
-            conn.commit()
 
     def _get_connection(self):
         """
-        Create and return a database connection.
+        Return the shared database connection.
 
         Returns:
             sqlite3.Connection: Database connection object
         """
-        # Use persistent connection for in-memory databases
-        if self._persistent_conn:
-            return self._persistent_conn
-        return sqlite3.connect(self.db_name)
+        return self._conn
+
+    def close(self):
+        """
+        Close the database connection.
+        The object cannot be used for queries afterwards.
+        """
+        with self._lock, self._read_lock:
+            if self._read_conn is not self._conn:
+                self._read_conn.close()
+            self._conn.close()
+            self._query_cache.clear()
+
+    def _cached_query(self, key, load):
+        """
+        Return a cached query result, loading and caching it on a miss.
+        The least recently used entry is dropped once the cache is full.
+
+        Args:
+            key (tuple): Cache key identifying the query
+            load (callable): Function that runs the query and returns a list
+
+        Returns:
+            list: A copy of the cached list of event dictionaries
+        """
+        with self._lock:
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                return list(self._query_cache[key])
+            generation = self._cache_generation
+
+        # Run the query without the write lock so saves are not held up
+        result = load()
+
+        with self._lock:
+            # Only cache the result if no write happened while it was loading
+            if generation == self._cache_generation:
+                self._query_cache[key] = result
+                if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return list(result)
+
+    def _clear_query_cache(self):
+        """
+        Forget all cached query results.
+        Called by every method that changes the events table.
+        """
+        with self._lock:
+            self._query_cache.clear()
+            self._cache_generation += 1
+
+    @property
+    def generation(self):
+        """
+        Counter that changes whenever the events table is written.
+        Lets callers keep results derived from a query and reuse them while
+        the counter is unchanged.
+        """
+        return self._cache_generation
 
     def _row_to_dict(self, row):
         """
         Convert a database row into a dictionary.
 
         Args:
-            row: Database row with event data
+            row (sqlite3.Row): Database row with event data
+
+        Returns:
+            dict: Dictionary with event data. is_all_day and is_recurring keep
+                  SQLite's 0/1 integers; Event.from_dict turns them into bools.
+        """
+        return dict(row)
+
+    def _event_to_row(self, event_data):
+        """
+        Convert an event dictionary into the positional column values used by
+        the batched statements in insert_events and update_events_bulk.
+
+        Args:
+            event_data (dict): Dictionary containing event data
 
         Returns:
-            dict: Dictionary with event data
-        """
-        event_id, title, description, date, start_day, end_day, start_time, end_time, is_all_day, is_recurring, recurrence_pattern = row[:11]
-
-        return {
-            'event_id': event_id,
-            'title': title,
-            'description': description,
-            'date': date,
-            'start_day': start_day,
-            'end_day': end_day,
-            'start_time': start_time,
-            'end_time': end_time,
-            'is_all_day': bool(is_all_day),
-            'is_recurring': bool(is_recurring),
-            'recurrence_pattern': recurrence_pattern
-        }
+            tuple: Column values in table order
+        """
+        return (
+            event_data['title'],
+            event_data.get('description', ''),
+            event_data['date'],
+            event_data['start_day'],
+            event_data['end_day'],
+            event_data['start_time'],
+            event_data['end_time'],
+            event_data.get('is_all_day', False),
+            event_data.get('is_recurring', False),
+            event_data.get('recurrence_pattern')
+        )
 
     def insert_event(self, event_data):
         """
@@ -118,29 +323,72 @@ class CalendarDatabase:
         Raises:
             Exception: If insert fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO events 
-                (title, description, date, start_day, end_day, 
-                 start_time, end_time, is_all_day, is_recurring, recurrence_pattern)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                event_data['title'],
-                event_data.get('description', ''),
-                event_data['date'],
-                event_data['start_day'],
-                event_data['end_day'],
-                event_data['start_time'],
-                event_data['end_time'],
-                event_data.get('is_all_day', False),
-                event_data.get('is_recurring', False),
-                event_data.get('recurrence_pattern')
-            ))
+        with self._lock, self._get_connection() as conn:
+            # Named parameters are read straight from the dictionary by sqlite3
+            cursor = conn.execute(self.INSERT_EVENT_SQL, {**self.EVENT_DEFAULTS, **event_data})
             event_id = cursor.lastrowid
-            conn.commit()
+            self._clear_query_cache()
             return event_id
 
+    def insert_events(self, events_data):
+        """
+        Insert several new events into the database in a single transaction.
+        Used for recurring events so a whole series is committed at once
+        instead of once per occurrence.
+
+        Args:
+            events_data (list): List of dictionaries containing event data
+
+        Returns:
+            List[int]: The auto-generated event_ids, in the same order as events_data
+
+        Raises:
+            Exception: If any insert fails (nothing is saved in that case)
+        """
+        with self._lock, self._get_connection() as conn:
+            event_ids = self._insert_event_rows(conn.cursor(), events_data)
+            self._clear_query_cache()
+        self._optimize_after_load(len(events_data))
+        return event_ids
+
+    def _optimize_after_load(self, inserted_count):
+        """
+        Let SQLite refresh the planner statistics after a large load, so the
+        date indexes keep being chosen. Runs after the insert has committed;
+        PRAGMA optimize only re-analyzes when the statistics are out of date.
+
+        Args:
+            inserted_count (int): Number of events just inserted
+        """
+        if inserted_count >= self.INSERT_BATCH_SIZE:
+            with self._lock:
+                self._conn.execute("PRAGMA optimize")
+
+    def _insert_event_rows(self, cursor, events_data):
+        """
+        Insert events with multi-row INSERT statements inside the caller's transaction.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor of the open write transaction
+            events_data (list): List of dictionaries containing event data
+
+        Returns:
+            List[int]: The auto-generated event_ids, in the same order as events_data
+        """
+        rows = [self._event_to_row(event_data) for event_data in events_data]
+        event_ids = []
+        # Write each batch as one multi-row INSERT ... VALUES (...), (...)
+        for start in range(0, len(rows), self.INSERT_BATCH_SIZE):
+            batch = rows[start:start + self.INSERT_BATCH_SIZE]
+            placeholders = ", ".join([self.EVENT_ROW_PLACEHOLDERS] * len(batch))
+            params = [value for row in batch for value in row]
+            cursor.execute(self.INSERT_EVENTS_PREFIX_SQL + placeholders, params)
+            # The transaction holds the write lock, so AUTOINCREMENT assigns
+            # the batch consecutive ids ending at the last inserted rowid
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+            event_ids.extend(range(last_id - len(batch) + 1, last_id + 1))
+        return event_ids
+
     def get_event_by_id(self, event_id):
         """
         Get a specific event by its ID.
@@ -154,19 +402,30 @@ class CalendarDatabase:
         Raises:
             Exception: If query fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT event_id, title, description, date, start_day, end_day,
-                       start_time, end_time, is_all_day, is_recurring, recurrence_pattern
-                FROM events WHERE event_id = ?
-            ''', (event_id,))
-            row = cursor.fetchone()
+        with self._read_lock:
+            row = self._read_conn.execute(self.GET_EVENT_BY_ID_SQL, (event_id,)).fetchone()
             
             if row:
                 return self._row_to_dict(row)
             return None
 
+    def _fetch_events(self, sql, params):
+        """
+        Run a SELECT_EVENTS_SQL query and return all of its rows.
+        The result is read completely while the read lock is held, so no
+        statement is left open on the shared read connection.
+
+        Args:
+            sql (str): Query built from SELECT_EVENTS_SQL
+            params (tuple): Query parameters
+
+        Returns:
+            List[dict]: Event data dictionaries
+        """
+        with self._read_lock:
+            rows = self._read_conn.execute(sql, params).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
     def get_events_for_month(self, year, month):
         """
         Get all events for a specific month and year.
@@ -182,26 +441,15 @@ class CalendarDatabase:
         Raises:
             Exception: If query fails
         """
-        
-        
-        # Calculate first and last day of month
+        # Use the half-open range [first day of month, first day of next month)
+        next_year, next_month = Calendar_Math.next_month(year, month)
         first_day = f"{year}-{month:02d}-01"
-        last_day = f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
-        
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            # Get events that start in month OR span into month
-            cursor.execute('''
-                SELECT event_id, title, description, date, start_day, end_day,
-                       start_time, end_time, is_all_day, is_recurring, recurrence_pattern
-                FROM events 
-                WHERE (date >= ? AND date <= ?)
-                   OR (start_day <= ? AND end_day >= ?)
-                ORDER BY date, start_time
-            ''', (first_day, last_day, last_day, first_day))
-            
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+        next_first_day = f"{next_year}-{next_month:02d}-01"
+
+        # Get events that start in month OR span into month
+        params = (first_day, next_first_day, next_first_day, first_day)
+        return self._cached_query(('month', year, month),
+                                  lambda: self._fetch_events(self.GET_EVENTS_FOR_MONTH_SQL, params))
 
     def get_events_for_date(self, date_str):
         """
@@ -217,19 +465,46 @@ class CalendarDatabase:
         Raises:
             Exception: If query fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            # Get events that start on this date OR span across it
-            cursor.execute('''
-                SELECT event_id, title, description, date, start_day, end_day,
-                       start_time, end_time, is_all_day, is_recurring, recurrence_pattern
-                FROM events 
-                WHERE ? BETWEEN start_day AND end_day
-                ORDER BY start_time
-            ''', (date_str,))
-            
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+        return self._cached_query(('date', date_str),
+                                  lambda: self._fetch_events(self.GET_EVENTS_FOR_DATE_SQL, (date_str,)))
+
+    def has_events_on_date(self, date_str):
+        """
+        Check whether any event occurs on a specific date.
+        Stops at the first match instead of loading every event for the date.
+
+        Args:
+            date_str (str): Date in YYYY-MM-DD format
+
+        Returns:
+            bool: True if at least one event occurs on that date
+
+        Raises:
+            Exception: If query fails
+        """
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute(self.HAS_EVENTS_ON_DATE_SQL, (date_str,))
+            return cursor.fetchone() is not None
+
+    def get_events_for_date_range(self, start_date_str, end_date_str):
+        """
+        Get all events that occur on any day within a date range.
+        Includes multi-day events that overlap the range.
+
+        Args:
+            start_date_str (str): First date of the range in YYYY-MM-DD format
+            end_date_str (str): Last date of the range in YYYY-MM-DD format
+
+        Returns:
+            List[dict]: List of event dictionaries overlapping the range
+
+        Raises:
+            Exception: If query fails
+        """
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute(self.GET_EVENTS_FOR_DATE_RANGE_SQL, (end_date_str, start_date_str))
+            # Convert rows straight off the cursor without an intermediate list
+            return list(map(self._row_to_dict, cursor))
 
     def update_event(self, event_data):
         """
@@ -248,30 +523,98 @@ class CalendarDatabase:
         if 'event_id' not in event_data:
             raise ValueError("event_id is required for update")
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE events SET 
-                title = ?, description = ?, date = ?, start_day = ?, end_day = ?,
-                start_time = ?, end_time = ?, is_all_day = ?, is_recurring = ?, 
-                recurrence_pattern = ?, modified_date = CURRENT_TIMESTAMP
-                WHERE event_id = ?
-            ''', (
-                event_data['title'],
-                event_data.get('description', ''),
-                event_data['date'],
-                event_data['start_day'],
-                event_data['end_day'],
-                event_data['start_time'],
-                event_data['end_time'],
-                event_data.get('is_all_day', False),
-                event_data.get('is_recurring', False),
-                event_data.get('recurrence_pattern'),
-                event_data['event_id']
-            ))
-            conn.commit()
+        with self._lock, self._get_connection() as conn:
+            conn.execute(self.UPDATE_EVENT_SQL, {**self.EVENT_DEFAULTS, **event_data})
+            self._clear_query_cache()
             return True
 
+    def update_events_bulk(self, events_data):
+        """
+        Update several existing events in a single transaction.
+        Each batch is merged into one UPDATE statement that picks the new
+        value for every row with CASE event_id WHEN ... THEN ... END.
+
+        Args:
+            events_data (list): List of event dictionaries, each with event_id
+
+        Returns:
+            int: Number of events updated
+
+        Raises:
+            ValueError: If an event_id is not provided
+            Exception: If update fails (nothing is saved in that case)
+        """
+        if any('event_id' not in event_data for event_data in events_data):
+            raise ValueError("event_id is required for update")
+
+        with self._lock, self._get_connection() as conn:
+            updated_count = self._update_event_rows(conn.cursor(), events_data)
+            self._clear_query_cache()
+        return updated_count
+
+    def _update_event_rows(self, cursor, events_data):
+        """
+        Update existing events with merged CASE statements inside the caller's transaction.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor of the open write transaction
+            events_data (list): List of event dictionaries, each with event_id
+
+        Returns:
+            int: Number of events updated
+        """
+        updated_count = 0
+        for start in range(0, len(events_data), self.UPDATE_BATCH_SIZE):
+            batch = events_data[start:start + self.UPDATE_BATCH_SIZE]
+            ids = [event_data['event_id'] for event_data in batch]
+            rows = [self._event_to_row(event_data) for event_data in batch]
+
+            case_sql = "CASE event_id " + "WHEN ? THEN ? " * len(batch) + "END"
+            set_sql = ", ".join(f"{column} = {case_sql}" for column in self.EVENT_COLUMNS)
+            params = []
+            for column_index in range(len(self.EVENT_COLUMNS)):
+                for event_id, row in zip(ids, rows):
+                    params.append(event_id)
+                    params.append(row[column_index])
+            params.extend(ids)
+
+            cursor.execute(f'''
+                UPDATE events SET {set_sql}, modified_date = CURRENT_TIMESTAMP
+                WHERE event_id IN ({", ".join("?" * len(ids))})
+            ''', params)
+            updated_count += cursor.rowcount
+        return updated_count
+
+    def save_events(self, updates, inserts):
+        """
+        Update existing events and insert new ones in a single transaction.
+        Either every change is saved or, if anything fails, none of them is.
+
+        Args:
+            updates (list): Event dictionaries to update, each with event_id
+            inserts (list): Event dictionaries to insert
+
+        Returns:
+            List[int]: The auto-generated event_ids of inserts, in the same order
+
+        Raises:
+            ValueError: If an event_id is missing or does not exist
+            Exception: If the update or insert fails (nothing is saved in that case)
+        """
+        if any('event_id' not in event_data for event_data in updates):
+            raise ValueError("event_id is required for update")
+
+        expected_count = len({event_data['event_id'] for event_data in updates})
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Raising here rolls back the transaction, including the updates
+            if self._update_event_rows(cursor, updates) != expected_count:
+                raise ValueError("Some events to update do not exist")
+            event_ids = self._insert_event_rows(cursor, inserts)
+            self._clear_query_cache()
+        self._optimize_after_load(len(inserts))
+        return event_ids
+
     def delete_event(self, event_id):
         """
         Delete an event from the database.
@@ -286,16 +629,44 @@ class CalendarDatabase:
             ValueError: If event_id does not exist
             Exception: If delete fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM events WHERE event_id = ?', (event_id,))
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute(self.DELETE_EVENT_SQL, (event_id,))
             rows_deleted = cursor.rowcount > 0
-            conn.commit()
-            
-            if not rows_deleted:
-                raise ValueError(f"Event with id {event_id} not found")
-            
-            return True
+            self._clear_query_cache()
+
+        if not rows_deleted:
+            raise ValueError(f"Event with id {event_id} not found")
+
+        return True
+
+    def delete_events(self, event_ids):
+        """
+        Delete several events in a single transaction.
+        Each batch of ids is removed with one DELETE ... WHERE event_id IN (...).
+        Ids that do not exist are ignored.
+
+        Args:
+            event_ids (iterable): The IDs of the events to delete
+
+        Returns:
+            int: Number of events deleted
+
+        Raises:
+            Exception: If delete fails (nothing is deleted in that case)
+        """
+        event_ids = list(event_ids)
+        deleted_count = 0
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(event_ids), self.DELETE_BATCH_SIZE):
+                batch = event_ids[start:start + self.DELETE_BATCH_SIZE]
+                cursor.execute(
+                    f'DELETE FROM events WHERE event_id IN ({", ".join("?" * len(batch))})',
+                    batch
+                )
+                deleted_count += cursor.rowcount
+            self._clear_query_cache()
+        return deleted_count
 
     def get_recurring_instances(self, title, recurrence_pattern, start_date):
         """
@@ -309,21 +680,10 @@ class CalendarDatabase:
         Returns:
             List[dict]: List of all recurring event instances
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT event_id, title, description, date, start_day, end_day,
-                       start_time, end_time, is_all_day, is_recurring, recurrence_pattern
-                FROM events 
-                WHERE title = ? 
-                  AND is_recurring = 1 
-                  AND recurrence_pattern = ?
-                  AND date >= ?
-                ORDER BY date
-            ''', (title, recurrence_pattern, start_date))
-            
-            rows = cursor.fetchall()
-            return [self._row_to_dict(row) for row in rows]
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute(self.GET_RECURRING_INSTANCES_SQL, (title, recurrence_pattern, start_date))
+            # Convert rows straight off the cursor without an intermediate list
+            return list(map(self._row_to_dict, cursor))
 
     def delete_recurring_instances(self, title, recurrence_pattern, start_date):
         """
@@ -337,15 +697,8 @@ class CalendarDatabase:
         Returns:
             int: Number of events deleted
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                DELETE FROM events 
-                WHERE title = ? 
-                  AND is_recurring = 1 
-                  AND recurrence_pattern = ?
-                  AND date >= ?
-            ''', (title, recurrence_pattern, start_date))
+        with self._lock, self._get_connection() as conn:
+            cursor = conn.execute(self.DELETE_RECURRING_INSTANCES_SQL, (title, recurrence_pattern, start_date))
             deleted_count = cursor.rowcount
-            conn.commit()
+            self._clear_query_cache()
             return deleted_count
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Calendar Math
+
+This file contains the small integer date calculations used by the view services
+every time a week or month is redrawn.
+
+The functions work on plain integers (date ordinals, years and months) so the
+callers can skip building intermediate date objects.
+"""
+
+
+# Days in each month of a non-leap year, January first
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def week_start_ordinal(date_ordinal):
+    """
+    Calculate the ordinal of the Sunday that starts the week.
+
+    Ordinal 1 (0001-01-01) is a Monday, so the number of days since the last
+    Sunday is simply the ordinal modulo 7.
+
+    Args:
+        date_ordinal (int): Date ordinal from datetime.date.toordinal()
+
+    Returns:
+        int: Ordinal of the Sunday on or before the given date
+    """
+    return date_ordinal - date_ordinal % 7
+
+
+def days_in_month(year, month):
+    """
+    Calculate the number of days in a month.
+
+    Args:
+        year (int): Year (e.g., 2025)
+        month (int): Month (1-12)
+
+    Returns:
+        int: Number of days in the month, accounting for leap years
+    """
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def next_month(year, month):
+    """
+    Calculate the next month and year.
+
+    Args:
+        year (int): Current year
+        month (int): Current month (1-12)
+
+    Returns:
+        Tuple[int, int]: (next_year, next_month)
+    """
+    return year + month // 12, month % 12 + 1
+
+
+def previous_month(year, month):
+    """
+    Calculate the previous month and year.
+
+    Args:
+        year (int): Current year
+        month (int): Current month (1-12)
+
+    Returns:
+        Tuple[int, int]: (previous_year, previous_month)
+    """
+    if month > 1:
+        return year, month - 1
+    return year - 1, 12
@@ -1,11 +1,68 @@
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
+from tkinter import messagebox
 
+import concurrent.futures
 import datetime
-from tkcalendar import DateEntry
+import difflib
+import functools
+import queue
 from DayViewService_Class import DayViewService
 
 
+# Runs calendar loads, saves and deletes so database work never blocks the Tk main loop
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_event_text(title, start_time, end_time, is_all_day, is_recurring,
+                       recurrence_pattern, start_day, end_day):
+    """
+    Build the listbox text for an event from its displayed fields.
+    Cached on those fields because the same events are re-listed after every
+    add, edit and delete; a changed event simply gets a new cache entry.
+    """
+    parts = [f"All Day: {title}" if is_all_day else f"{start_time} - {end_time}: {title}"]
+
+    if is_recurring:
+        parts.append(f" (Repeats {recurrence_pattern})")
+
+    if start_day != end_day:
+        parts.append(f" [{start_day} to {end_day}]")
+
+    # Join once instead of building a new string for every appended part
+    return "".join(parts)
+
+
+class _DateField(tk.Entry):
+    """
+    Read-only entry that shows a date as dd-mm-yyyy.
+
+    It offers the get_date/set_date methods of tkcalendar's DateEntry, so the
+    form code can use it in the same way, but it does not build a calendar of
+    its own. The day view picks dates with one shared calendar popup instead.
+    """
+
+    DATE_FORMAT = "%d-%m-%Y"
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, state="readonly", **kwargs)
+        self._date = None
+
+    def get_date(self):
+        """Return the date currently shown in the field."""
+        return self._date
+
+    def set_date(self, date):
+        """Show a new date in the field."""
+        self._date = date
+        self.config(state="normal")
+        self.delete(0, tk.END)
+        self.insert(0, date.strftime(self.DATE_FORMAT))
+        self.config(state="readonly")
+
+
 class DayViewGUI:
     """
     A GUI class that displays a detailed day view for managing events.
@@ -31,11 +88,33 @@ class DayViewGUI:
     LABEL_FONT = ("Arial", 10, "bold")
     NORMAL_FONT = ("Arial", 10)
     SMALL_FONT = ("Arial", 9)
+    SMALL_BOLD_FONT = ("Arial", 9, "bold")
+    TINY_FONT = ("Arial", 8)
     BUTTON_PADDING = 5
     FRAME_PADDING = 10
     DEFAULT_START_TIME = "09:00 AM"
     DEFAULT_END_TIME = "10:00 AM"
-    
+    REFRESH_DEBOUNCE_MS = 30
+    RESULT_POLL_MS = 20
+    # Set once the font tuples above have been replaced by shared Font objects
+    _fonts_created = False
+
+    @classmethod
+    def _ensure_fonts(cls):
+        """
+        Replace the font tuples with tkinter Font objects shared by every day view.
+        Tk then resolves each font once instead of for every widget. This runs on
+        first use because Font objects need an existing Tk root.
+        """
+        if cls._fonts_created:
+            return
+        for name in ("HEADER_FONT", "SECTION_FONT", "LABEL_FONT", "NORMAL_FONT",
+                     "SMALL_FONT", "SMALL_BOLD_FONT", "TINY_FONT"):
+            family, size, *style = getattr(cls, name)
+            setattr(cls, name, tkfont.Font(family=family, size=size,
+                                           weight="bold" if "bold" in style else "normal"))
+        cls._fonts_created = True
+
     @staticmethod
     def generate_time_options():
         """Generate time options in 30-minute increments for 24 hours."""
@@ -85,7 +164,7 @@ class DayViewGUI:
         # Check if the date is valid (current or future) using calendar
         if self.selected_date < self.calendar.get_today():
             # Show a warning popup if user tries to view past dates
-            tk.messagebox.showwarning("Invalid Date", "Cannot view or edit events for past dates.")
+            messagebox.showwarning("Invalid Date", "Cannot view or edit events for past dates.")
             # Exit early - don't create the window if date is invalid
             return
 
@@ -95,7 +174,12 @@ class DayViewGUI:
     def create_day_view_window(self):
         """Create and setup the day view window with all components."""
         self.window = tk.Toplevel()
-        self.window.title(f"Day View - {self.selected_date.strftime('%d-%m-%Y')}")
+        # Keep the window hidden while it is filled in, so it appears once fully laid out
+        self.window.withdraw()
+        self._ensure_fonts()
+        # The title and the header show the same DD-MM-YYYY text, so format it once
+        date_text = self.day_service.format_date_for_display(self.selected_date)
+        self.window.title(f"Day View - {date_text}")
         self.window.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
         self.window.resizable(True, True)
 
@@ -104,7 +188,7 @@ class DayViewGUI:
 
         header_label = tk.Label(
             header_frame,
-            text=self.day_service.format_date_for_display(self.selected_date),
+            text=date_text,
             font=self.HEADER_FONT
         )
         header_label.pack()
@@ -118,8 +202,17 @@ class DayViewGUI:
         scrollbar = tk.Scrollbar(listbox_frame)
         scrollbar.pack(side="right", fill="y")
 
-        self.events_listbox = tk.Listbox(listbox_frame, yscrollcommand=scrollbar.set, font=self.NORMAL_FONT)
+        # exportselection=0 keeps selection changes away from the X selection and
+        # activestyle='none' skips drawing the active-item underline
+        self.events_listbox = tk.Listbox(listbox_frame, yscrollcommand=scrollbar.set, font=self.NORMAL_FONT,
+                                         exportselection=0, activestyle='none')
         self.events_listbox.pack(side="left", fill="both", expand=True)
+        # Index of the selected row, kept up to date by <<ListboxSelect>>
+        self._selected_index = None
+        self.events_listbox.bind("<<ListboxSelect>>", self._on_select)
+        # Double-click or Enter on an event opens it for editing straight away
+        self.events_listbox.bind("<Double-Button-1>", lambda e: self.edit_event_dialog())
+        self.events_listbox.bind("<Return>", lambda e: self.edit_event_dialog())
         scrollbar.config(command=self.events_listbox.yview)
 
         buttons_frame = tk.Frame(self.window)
@@ -131,41 +224,208 @@ class DayViewGUI:
         tk.Button(buttons_frame, text="Edit Selected Event", command=self.edit_event_dialog,
                   font=self.NORMAL_FONT, bg="lightblue").pack(side="left", padx=self.BUTTON_PADDING)
         
-        tk.Button(buttons_frame, text="Delete Selected Event", command=self.delete_event,
-                  font=self.NORMAL_FONT, bg="lightcoral").pack(side="left", padx=self.BUTTON_PADDING)
+        self._delete_button = tk.Button(buttons_frame, text="Delete Selected Event", command=self.delete_event,
+                                        font=self.NORMAL_FONT, bg="lightcoral")
+        self._delete_button.pack(side="left", padx=self.BUTTON_PADDING)
         
         tk.Button(buttons_frame, text="Close", command=self.window.destroy,
                   font=self.NORMAL_FONT).pack(side="right", padx=self.BUTTON_PADDING)
 
         self.current_events = []
+        # Add/Edit form, built on first use and then hidden and reused
+        self._form_dialog = None
+        # Event being edited in the form, or None when adding a new one
+        self._form_event = None
+        # Calendar popup shared by the Start Date and End Date fields
+        self._date_popup = None
+        # Delete confirmation window, built on first use and then hidden and reused
+        self._confirm_dialog = None
+        # Timer id of the queued refresh, and whether one is waiting for the window to be shown
+        self._refresh_pending = None
+        self._refresh_on_map = False
+        # Set when a queued refresh also has to redraw the parent view
+        self._refresh_parent = False
+        # Rows currently shown in the listbox, to skip redrawing identical content
+        self._listbox_texts = []
+        # Bumped for every fetch so results from an older, slower fetch are dropped
+        self._fetch_generation = 0
+        # Finished (callback, future) pairs put here by worker threads for the Tk thread
+        self._results = queue.Queue()
+        # Background calls not yet handed to their callback, and the timer id of the poll
+        self._pending_work = 0
+        self._poll_id = None
+        self.window.bind("<Map>", self._on_window_map)
         self.refresh_events_list()
 
-    def refresh_events_list(self):
-        """Refresh the events listbox with current events for the selected date."""
-        self.events_listbox.delete(0, tk.END)
-        self.current_events = self.day_service.get_events_for_date(self.selected_date)
+        self.window.update_idletasks()
+        self.window.deiconify()
 
-        if not self.current_events:
-            self.events_listbox.insert(tk.END, "No events scheduled for this day")
+    def _schedule_refresh(self, refresh_parent=True):
+        """
+        Refresh this view and the parent view once changes stop arriving.
+        Each call restarts a short timer, so a burst of changes is coalesced
+        into a single refresh.
+
+        Args:
+            refresh_parent (bool): Whether the parent view needs redrawing too
+        """
+        self._refresh_parent = self._refresh_parent or refresh_parent
+        if self._refresh_pending is not None:
+            self.window.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.window.after(self.REFRESH_DEBOUNCE_MS, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a queued refresh, deferring the event list while the window is hidden."""
+        self._refresh_pending = None
+        if not self.window.winfo_exists():
+            return
+
+        if self.window.winfo_viewable():
+            self.refresh_events_list()
         else:
-            for event in self.current_events:
-                event_text = self._format_event_for_display(event)
-                self.events_listbox.insert(tk.END, event_text)
+            # Redraw when the window is shown again instead of while nobody can see it
+            self._refresh_on_map = True
 
-    def _format_event_for_display(self, event):
-        """Format an event for display in the listbox."""
-        if event.is_all_day:
-            event_text = f"All Day: {event.title}"
+        if self.parent_gui and self._refresh_parent:
+            self.parent_gui.refresh_calendar_display()
+        self._refresh_parent = False
+
+    def _on_window_map(self, event=None):
+        """Run a refresh that was deferred while the window was hidden."""
+        if self._refresh_on_map:
+            self._refresh_on_map = False
+            self.refresh_events_list()
+
+    def refresh_events_list(self, on_loaded=None):
+        """
+        Refresh the events listbox with current events for the selected date.
+        The events are fetched on a worker thread so a day with many recurring
+        occurrences doesn't freeze the window. The current rows stay in place
+        (or a placeholder on the first load) until _apply_fetched_events
+        replaces them.
+
+        Args:
+            on_loaded (callable, optional): Called on the Tk thread once
+                current_events holds the fetched events
+        """
+        self._fetch_generation += 1
+        if not self.events_listbox.size():
+            self._listbox_texts = ["Loading..."]
+            self.events_listbox.insert(tk.END, *self._listbox_texts)
+
+        generation = self._fetch_generation
+        self._run_in_background(
+            functools.partial(self.day_service.get_events_for_date, self.selected_date),
+            lambda future: self._on_fetch_done(future, generation, on_loaded)
+        )
+
+    def _run_in_background(self, work, on_done):
+        """
+        Run work() on the worker pool and pass its future to on_done on the Tk thread.
+        The worker only puts the finished future on a queue; _drain_results
+        picks it up from an after() poll, so only the Tk thread touches widgets.
+
+        Args:
+            work (callable): Calendar call to run, without touching any widgets
+            on_done (callable): Called with the finished future once Tk is free
+        """
+        future = _EXECUTOR.submit(work)
+        future.add_done_callback(lambda finished: self._results.put((on_done, finished)))
+        self._pending_work += 1
+        if self._poll_id is None:
+            # Poll through the main window, which outlives this one, so work
+            # that finishes after the day view is closed is still collected
+            self._poll_id = self.window.master.after(self.RESULT_POLL_MS, self._drain_results)
+
+    def _drain_results(self):
+        """Hand finished background work to its callback, polling again while any is left."""
+        self._poll_id = None
+        while True:
+            try:
+                on_done, future = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._pending_work -= 1
+            try:
+                if self.window.winfo_exists():
+                    on_done(future)
+                else:
+                    # Nothing left to update, but a failed save or delete still has to be reported
+                    future.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"Calendar operation failed: {e}")
+
+        if self._pending_work:
+            self._poll_id = self.window.master.after(self.RESULT_POLL_MS, self._drain_results)
+
+    def _on_fetch_done(self, future, generation, on_loaded):
+        """Show the events from a background fetch, or an error row if it failed."""
+        try:
+            events = future.result()
+        except Exception:
+            # Replace the rows before _drain_results reports the error, and forget
+            # the old events so Edit and Delete can't act on rows no longer shown
+            if generation == self._fetch_generation:
+                self.current_events = []
+                self._listbox_texts = []
+                self.events_listbox.delete(0, tk.END)
+                self._selected_index = None
+                self._update_listbox_rows(["Could not load events"])
+            raise
+        self._apply_fetched_events(events, generation, on_loaded)
+
+    def _apply_fetched_events(self, events, generation, on_loaded=None):
+        """Show events fetched by refresh_events_list unless a newer fetch has started."""
+        if generation != self._fetch_generation or not self.window.winfo_exists():
+            return
+
+        self.current_events = events
+        if self.current_events:
+            event_texts = [self._format_event_for_display(event) for event in self.current_events]
         else:
-            event_text = f"{event.start_time} - {event.end_time}: {event.title}"
+            event_texts = ["No events scheduled for this day"]
 
-        if event.is_recurring:
-            event_text += f" (Repeats {event.recurrence_pattern})"
+        # Leave the listbox (and its selection) alone when the rows haven't changed
+        if event_texts != self._listbox_texts:
+            self._update_listbox_rows(event_texts)
 
-        if event.start_day != event.end_day:
-            event_text += f" [{event.start_day} to {event.end_day}]"
+        if on_loaded is not None:
+            on_loaded()
 
-        return event_text
+    def _update_listbox_rows(self, new_texts):
+        """
+        Change only the listbox rows that differ from new_texts.
+        A typical save touches one row, so the rest of the list (and the
+        selection, if its row survives) stays as it is.
+
+        Args:
+            new_texts (list): Row texts the listbox should show
+        """
+        matcher = difflib.SequenceMatcher(None, self._listbox_texts, new_texts, autojunk=False)
+        selected_index = None
+
+        # Work from the end so the row numbers of earlier changes stay valid
+        for tag, old_start, old_end, new_start, new_end in reversed(matcher.get_opcodes()):
+            if tag == 'equal':
+                # Tk moves the selection along with its row, so just follow it
+                if self._selected_index is not None and old_start <= self._selected_index < old_end:
+                    selected_index = new_start + self._selected_index - old_start
+                continue
+            if old_end > old_start:
+                self.events_listbox.delete(old_start, old_end - 1)
+            if new_end > new_start:
+                # Insert each block of rows with one Tk call
+                self.events_listbox.insert(old_start, *new_texts[new_start:new_end])
+
+        # A deleted or replaced row takes its selection with it, without firing <<ListboxSelect>>
+        self._selected_index = selected_index
+        self._listbox_texts = new_texts
+
+    def _format_event_for_display(self, event):
+        """Format an event for display in the listbox."""
+        return _format_event_text(event.title, event.start_time, event.end_time, event.is_all_day,
+                                  event.is_recurring, event.recurrence_pattern,
+                                  event.start_day, event.end_day)
 
     def toggle_recurrence_options(self, show, recurrence_frame):
         """Show or hide the recurrence options frame."""
@@ -182,21 +442,26 @@ class DayViewGUI:
         # Call the main form dialog with "Add" title and no event index (new event)
         self.event_form_dialog("Add New Event")
 
-    def edit_event_dialog(self):
-        """Open a dialog to edit the selected event."""
-        # Get which item is currently selected in the events listbox
-        # curselection() returns a tuple of selected indices
+    def _on_select(self, event=None):
+        """Remember which row is selected so the buttons don't have to ask Tk."""
         selection = self.events_listbox.curselection()
+        self._selected_index = selection[0] if selection else None
 
+    def edit_event_dialog(self):
+        """Open a dialog to edit the selected event."""
         # Check if user actually selected an event
-        if not selection:
+        if self._selected_index is None:
             # Show warning if no event is selected
-            tk.messagebox.showwarning("No Selection", "Please select an event to edit.")
+            messagebox.showwarning("No Selection", "Please select an event to edit.")
+            return
+
+        # The list may still be loading, or showing the "No events" row
+        if self._selected_index >= len(self.current_events):
+            messagebox.showwarning("No Event", "No valid event selected to edit.")
             return
 
         # Call the form dialog with "Edit" title and the index of selected event
-        # selection[0] gets the first (and only) selected item's index
-        self.event_form_dialog("Edit Event", selection[0])
+        self.event_form_dialog("Edit Event", self._selected_index)
 
     def event_form_dialog(self, title, event_index=None):
         """
@@ -206,30 +471,133 @@ class DayViewGUI:
             title (str): Title of the dialog window
             event_index (int, optional): Index of event to edit (None for new event)
         """
-        # Step 1: Create the popup dialog window with title
-        dialog = self.create_form_dialog_window(title)
+        editing = event_index is not None and bool(self.current_events)
+
+        # The Save button reads this, so one dialog serves both adding and editing.
+        # Keep the Event itself: a refresh while the form is open can reorder the list
+        self._form_event = self.current_events[event_index] if editing else None
+
+        if self._form_dialog is not None and self._form_dialog.winfo_exists():
+            # Reuse the hidden dialog instead of building all the widgets again
+            dialog = self._form_dialog
+            dialog.title(title)
+            # Editing sets every field itself, so only a new event needs the defaults
+            if not editing:
+                self._reset_form_fields()
+        else:
+            # Step 1: Create the popup dialog window with title
+            dialog = self.create_form_dialog_window(title)
+
+            # Step 2: Create all the input fields (title, date, time, etc.) and get references to them
+            fields_frame, form_fields = self.create_form_fields(dialog)
+
+            # Step 3: Create the recurring event options section
+            recurrence_frame, recurrence_var = self.create_recurrence_options(fields_frame,
+                                                                              form_fields['recurring_var'])
+
+            # Step 4: Create Save and Cancel buttons at bottom of form
+            self.create_form_buttons(dialog)
 
-        # Step 2: Create all the input fields (title, date, time, etc.) and get references to them
-        fields_frame, form_fields = self.create_form_fields(dialog)
+            # Work out the layout while still hidden so the first paint is the finished form
+            dialog.update_idletasks()
 
-        # Step 3: Create the recurring event options section
-        recurrence_frame, recurrence_var = self.create_recurrence_options(fields_frame, form_fields['recurring_var'])
+            self._form_dialog = dialog
+            self._form_fields = form_fields
+            self._recurrence_var = recurrence_var
+            self._recurrence_frame = recurrence_frame
 
-        # Step 4: If editing existing event, fill in the form with current values
-        if event_index is not None and self.current_events:
-            self.populate_form_for_editing(event_index, form_fields, recurrence_var, recurrence_frame)
+        # Step 5: If editing existing event, fill in the form with current values
+        if editing:
+            self.populate_form_for_editing(event_index, self._form_fields,
+                                           self._recurrence_var, self._recurrence_frame)
 
-        # Step 5: Create Save and Cancel buttons at bottom of form
-        self.create_form_buttons(dialog, form_fields, recurrence_var, event_index)
+        dialog.deiconify()
+        dialog.grab_set()
+
+    def _hide_form_dialog(self, dialog):
+        """Hide the form dialog so the next Add/Edit can reuse it."""
+        if self._date_popup is not None and self._date_popup.winfo_exists():
+            self._date_popup.withdraw()
+        dialog.grab_release()
+        dialog.withdraw()
+
+    def _open_date_picker(self, date_field):
+        """
+        Show the shared calendar popup below a date field.
+
+        Both date fields of the form use this one calendar, which is built the
+        first time it's needed and hidden again once a day is picked.
+
+        Args:
+            date_field (_DateField): The field that receives the chosen date
+        """
+        if self._date_popup is None or not self._date_popup.winfo_exists():
+            # Imported here so tkcalendar (and its babel locale data) only loads
+            # once a date is actually picked, not when the app starts
+            from tkcalendar import Calendar
+
+            self._date_popup = tk.Toplevel(self._form_dialog)
+            self._date_popup.withdraw()
+            self._date_popup.title("Choose Date")
+            self._date_popup.transient(self._form_dialog)
+            self._date_popup.resizable(False, False)
+            self._date_popup.protocol("WM_DELETE_WINDOW", self._date_popup.withdraw)
+
+            self._shared_calendar = Calendar(self._date_popup, selectmode='day', font=self.NORMAL_FONT,
+                                             background='darkblue', foreground='white',  # Color scheme
+                                             borderwidth=2, date_pattern='dd-mm-yyyy',  # Format: 16-11-2025
+                                             mindate=datetime.date.today())  # Can't select past dates
+            self._shared_calendar.pack(padx=5, pady=5)
+            self._shared_calendar.bind("<<CalendarSelected>>", self._on_date_picked)
+
+        self._date_target = date_field
+        self._shared_calendar.selection_set(date_field.get_date())
+        self._shared_calendar.see(date_field.get_date())
+
+        # Place the popup just below the field, like DateEntry's drop-down
+        x = date_field.winfo_rootx()
+        y = date_field.winfo_rooty() + date_field.winfo_height()
+        self._date_popup.geometry(f"+{x}+{y}")
+        self._date_popup.deiconify()
+        self._date_popup.lift()
+
+    def _on_date_picked(self, event=None):
+        """Write the day picked in the shared calendar back to its date field."""
+        self._date_target.set_date(self._shared_calendar.selection_get())
+        self._date_popup.withdraw()
+
+    def _reset_form_fields(self):
+        """Put every field of the reused form dialog back to its default value."""
+        form_fields = self._form_fields
+
+        form_fields['title_var'].set("")
+        form_fields['start_date_entry'].set_date(self.selected_date)
+        form_fields['end_date_entry'].set_date(self.selected_date)
+
+        form_fields['all_day_var'].set(False)
+        form_fields['start_time_entry'].config(state='readonly')
+        form_fields['end_time_entry'].config(state='readonly')
+        form_fields['start_time_var'].set(self.DEFAULT_START_TIME)
+        form_fields['end_time_var'].set(self.DEFAULT_END_TIME)
+
+        form_fields['description_text'].delete("1.0", tk.END)
+        form_fields['update_char_count']()
+
+        form_fields['recurring_var'].set(False)
+        self._recurrence_var.set("weekly")
+        self.toggle_recurrence_options(False, self._recurrence_frame)
 
     def create_form_dialog_window(self, title):
         """Create and configure the dialog window."""
         dialog = tk.Toplevel(self.window)
+        # Stay hidden while the widgets are added; event_form_dialog shows it once it's complete
+        dialog.withdraw()
         dialog.title(title)
         dialog.geometry(f"{self.DIALOG_WIDTH}x{self.DIALOG_HEIGHT}")
         dialog.resizable(False, False)
         dialog.transient(self.window)
-        dialog.grab_set()
+        # Closing the window only hides it, like the Cancel button
+        dialog.protocol("WM_DELETE_WINDOW", self._cancel_form)
         return dialog
 
     def create_form_fields(self, dialog):
@@ -249,53 +617,52 @@ class DayViewGUI:
 
         # Create label and input field for event title
         # Label shows "Event Title:" in bold font
-        tk.Label(fields_frame, text="Event Title:", font=("Arial", 10, "bold")).grid(row=0, column=0, sticky="w",
-                                                                                     pady=5)
-        # Entry widget for user to type the event name
-        title_entry = tk.Entry(fields_frame, font=("Arial", 10), width=30)
+        tk.Label(fields_frame, text="Event Title:", font=self.LABEL_FONT).grid(row=0, column=0, sticky="w", pady=5)
+        # Entry widget for user to type the event name, backed by a StringVar so it can be set in one write
+        title_var = tk.StringVar()
+        title_entry = tk.Entry(fields_frame, font=self.NORMAL_FONT, width=30, textvariable=title_var)
         # Place in grid: row 0, column 1, span across 2 columns, align to left (west)
         title_entry.grid(row=0, column=1, columnspan=2, pady=5, padx=5, sticky="w")
 
-        # Create label and date picker for event start date
-        tk.Label(fields_frame, text="Start Date:", font=("Arial", 10, "bold")).grid(row=1, column=0, sticky="w", pady=5)
-        # DateEntry is a special widget that shows a calendar popup for date selection
-        start_date_entry = DateEntry(fields_frame, font=("Arial", 10), width=12,
-                                     background='darkblue', foreground='white',  # Color scheme
-                                     borderwidth=2, date_pattern='dd-mm-yyyy',  # Format: 16-11-2025
-                                     mindate=datetime.date.today())  # Can't select past dates
+        # Create label and date field for event start date
+        tk.Label(fields_frame, text="Start Date:", font=self.LABEL_FONT).grid(row=1, column=0, sticky="w", pady=5)
+        # The date field only shows the date; the "..." button opens the shared calendar popup
+        start_date_entry = _DateField(fields_frame, font=self.NORMAL_FONT, width=12)
         start_date_entry.grid(row=1, column=1, pady=5, padx=5, sticky="w")
+        tk.Button(fields_frame, text="...", font=self.SMALL_FONT,
+                  command=lambda: self._open_date_picker(start_date_entry)).grid(row=1, column=2, sticky="w")
         # Set the default date to the currently selected day
         start_date_entry.set_date(self.selected_date)
 
-        # Create label and date picker for event end date
-        tk.Label(fields_frame, text="End Date:", font=("Arial", 10, "bold")).grid(row=2, column=0, sticky="w", pady=5)
-        # Another DateEntry widget for the event end date (for multi-day events)
-        end_date_entry = DateEntry(fields_frame, font=("Arial", 10), width=12,
-                                   background='darkblue', foreground='white',
-                                   borderwidth=2, date_pattern='dd-mm-yyyy',
-                                   mindate=datetime.date.today())
+        # Create label and date field for event end date
+        tk.Label(fields_frame, text="End Date:", font=self.LABEL_FONT).grid(row=2, column=0, sticky="w", pady=5)
+        # Another date field for the event end date (for multi-day events), using the same popup
+        end_date_entry = _DateField(fields_frame, font=self.NORMAL_FONT, width=12)
         end_date_entry.grid(row=2, column=1, pady=5, padx=5, sticky="w")
+        tk.Button(fields_frame, text="...", font=self.SMALL_FONT,
+                  command=lambda: self._open_date_picker(end_date_entry)).grid(row=2, column=2, sticky="w")
         # Default end date is same as start date (single day event)
         end_date_entry.set_date(self.selected_date)
 
         # Create label and dropdown menu for event start time
-        tk.Label(fields_frame, text="Start Time:", font=("Arial", 10, "bold")).grid(row=3, column=0, sticky="w", pady=5)
+        tk.Label(fields_frame, text="Start Time:", font=self.LABEL_FONT).grid(row=3, column=0, sticky="w", pady=5)
         # Combobox (dropdown) for start time with 30-minute increments
         time_options = self.generate_time_options()
-        start_time_entry = ttk.Combobox(fields_frame, font=("Arial", 10), width=13, 
+        # The StringVar holds the value, so changing the time is a single variable write
+        # Default start time of 9:00 AM
+        start_time_var = tk.StringVar(value=self.DEFAULT_START_TIME)
+        start_time_entry = ttk.Combobox(fields_frame, font=self.NORMAL_FONT, width=13, textvariable=start_time_var,
                                         values=time_options, state="readonly")
         start_time_entry.grid(row=3, column=1, pady=5, padx=5, sticky="w")
-        # Set default start time of 9:00 AM
-        start_time_entry.set("09:00 AM")
 
         # Create label and dropdown menu for event end time
-        tk.Label(fields_frame, text="End Time:", font=("Arial", 10, "bold")).grid(row=4, column=0, sticky="w", pady=5)
+        tk.Label(fields_frame, text="End Time:", font=self.LABEL_FONT).grid(row=4, column=0, sticky="w", pady=5)
         # Combobox (dropdown) for end time with 30-minute increments
-        end_time_entry = ttk.Combobox(fields_frame, font=("Arial", 10), width=13,
+        # Default end time of 10:00 AM (1 hour event)
+        end_time_var = tk.StringVar(value=self.DEFAULT_END_TIME)
+        end_time_entry = ttk.Combobox(fields_frame, font=self.NORMAL_FONT, width=13, textvariable=end_time_var,
                                       values=time_options, state="readonly")
         end_time_entry.grid(row=4, column=1, pady=5, padx=5, sticky="w")
-        # Set default end time of 10:00 AM (1 hour event)
-        end_time_entry.set("10:00 AM")
 
         # Create checkbox for "All Day Event" option
         # BooleanVar() stores True/False value for checkbox state
@@ -304,36 +671,48 @@ class DayViewGUI:
             fields_frame,
             text="All Day Event",  # Text shown next to checkbox
             variable=all_day_var,  # Variable that stores checked state
-            font=("Arial", 10),
+            font=self.NORMAL_FONT,
             # When clicked, call toggle_time_fields to enable/disable time inputs
-            command=lambda: self.toggle_time_fields(all_day_var, start_time_entry, end_time_entry)
+            command=lambda: self.toggle_time_fields(all_day_var, start_time_entry, end_time_entry,
+                                                    start_time_var, end_time_var)
         )
         all_day_check.grid(row=5, column=1, sticky="w", pady=5)
 
         # Create label and text area for event description
         # sticky="nw" means align to top-left (north-west) since text area is tall
-        tk.Label(fields_frame, text="Description:", font=("Arial", 10, "bold")).grid(row=6, column=0, sticky="nw",
-                                                                                     pady=5)
+        tk.Label(fields_frame, text="Description:", font=self.LABEL_FONT).grid(row=6, column=0, sticky="nw", pady=5)
         # Text widget allows multiple lines of text input (unlike Entry which is single line)
-        description_text = tk.Text(fields_frame, font=("Arial", 10), width=30, height=4)
+        description_text = tk.Text(fields_frame, font=self.NORMAL_FONT, width=30, height=4)
         description_text.grid(row=6, column=1, columnspan=2, pady=5, padx=5, sticky="w")
         
         # Character counter for description (80 character limit)
-        char_count_label = tk.Label(fields_frame, text="0/80 characters", font=("Arial", 8), fg="gray")
+        char_count_label = tk.Label(fields_frame, text="0/80 characters", font=self.TINY_FONT, fg="gray")
         char_count_label.grid(row=7, column=1, sticky="w", padx=5)
         
         # Update character count as user types
         def update_char_count(event=None):
-            text = description_text.get("1.0", tk.END).strip()
-            count = len(text)
-            char_count_label.config(text=f"{count}/80 characters")
-            # Change color if over limit
-            if count > 80:
-                char_count_label.config(fg="red")
-            else:
-                char_count_label.config(fg="gray")
-        
-        description_text.bind("<KeyRelease>", update_char_count)
+            # Count the stripped text, the same value _extract_form_data saves and the 80 limit checks
+            count = len(description_text.get("1.0", tk.END).strip())
+            pending_update[0] = None
+            # Update text and color (red if over limit) in one configure call
+            char_count_label.config(text=f"{count}/80 characters", fg="red" if count > 80 else "gray")
+
+        # Id of the queued counter update, so a burst of keystrokes updates it once
+        pending_update = [None]
+
+        def schedule_char_count(event=None):
+            if pending_update[0] is not None:
+                description_text.after_cancel(pending_update[0])
+            pending_update[0] = description_text.after(50, update_char_count)
+
+        def cancel_char_count(event=None):
+            # Don't let a queued update run after the dialog has been closed
+            if pending_update[0] is not None:
+                description_text.after_cancel(pending_update[0])
+                pending_update[0] = None
+
+        description_text.bind("<KeyRelease>", schedule_char_count)
+        description_text.bind("<Destroy>", cancel_char_count)
 
         # Create variable to store whether this is a recurring event
         recurring_var = tk.BooleanVar()
@@ -341,10 +720,13 @@ class DayViewGUI:
         # Store all form fields in a dictionary for easy access
         form_fields = {
             'title_entry': title_entry,
+            'title_var': title_var,
             'start_date_entry': start_date_entry,
             'end_date_entry': end_date_entry,
             'start_time_entry': start_time_entry,
             'end_time_entry': end_time_entry,
+            'start_time_var': start_time_var,
+            'end_time_var': end_time_var,
             'all_day_var': all_day_var,
             'description_text': description_text,
             'recurring_var': recurring_var,
@@ -370,19 +752,19 @@ class DayViewGUI:
             fields_frame,
             text="Recurring Event",
             variable=recurring_var,
-            font=("Arial", 10),
+            font=self.NORMAL_FONT,
             command=lambda: self.toggle_recurrence_options(recurring_var.get(), recurrence_frame)
         )
         recurring_check.grid(row=8, column=1, sticky="w", pady=5)
 
         # Recurrence options frame (initially hidden)
-        recurrence_frame = tk.LabelFrame(fields_frame, text="Recurrence Options", font=("Arial", 9, "bold"))
+        recurrence_frame = tk.LabelFrame(fields_frame, text="Recurrence Options", font=self.SMALL_BOLD_FONT)
         recurrence_frame.grid(row=9, column=0, columnspan=3, sticky="ew", pady=10, padx=5)
         recurrence_frame.grid_remove()  # Hide initially
 
         # Recurrence pattern selection
-        tk.Label(recurrence_frame, text="Repeat every:", font=("Arial", 9)).grid(row=0, column=0, sticky="w", padx=5,
-                                                                                 pady=2)
+        tk.Label(recurrence_frame, text="Repeat every:", font=self.SMALL_FONT).grid(row=0, column=0, sticky="w",
+                                                                                    padx=5, pady=2)
 
         recurrence_var = tk.StringVar(value="weekly")
         recurrence_options = [
@@ -398,7 +780,7 @@ class DayViewGUI:
                 text=text,
                 variable=recurrence_var,
                 value=value,
-                font=("Arial", 9)
+                font=self.SMALL_FONT
             ).grid(row=1, column=i, sticky="w", padx=5, pady=2)
 
         return recurrence_frame, recurrence_var
@@ -406,6 +788,7 @@ class DayViewGUI:
     def populate_form_for_editing(self, event_index, form_fields, recurrence_var, recurrence_frame):
         """
         Populate form fields with existing event data for editing.
+        Every field is set here, so a reused dialog doesn't need resetting first.
 
         Args:
             event_index (int): Index of the event to edit
@@ -416,17 +799,11 @@ class DayViewGUI:
         existing_event = self.current_events[event_index]
 
         # Populate basic fields
-        form_fields['title_entry'].insert(0, existing_event.title)
+        form_fields['title_var'].set(existing_event.title)
 
-        # Parse and set start/end dates
-        try:
-            start_date_obj = datetime.datetime.strptime(existing_event.start_day, "%Y-%m-%d").date()
-            end_date_obj = datetime.datetime.strptime(existing_event.end_day, "%Y-%m-%d").date()
-            form_fields['start_date_entry'].set_date(start_date_obj)
-            form_fields['end_date_entry'].set_date(end_date_obj)
-        except ValueError:
-            # Fallback to selected date if parsing fails
-            pass
+        # Set start/end dates
+        form_fields['start_date_entry'].set_date(existing_event.start_date)
+        form_fields['end_date_entry'].set_date(existing_event.end_date)
 
         # Set all-day status first
         form_fields['all_day_var'].set(existing_event.is_all_day)
@@ -435,18 +812,16 @@ class DayViewGUI:
             # For all-day events, disable time fields and show "All Day"
             form_fields['start_time_entry'].config(state='disabled')
             form_fields['end_time_entry'].config(state='disabled')
-            form_fields['start_time_entry'].delete(0, tk.END)
-            form_fields['start_time_entry'].insert(0, "All Day")
-            form_fields['end_time_entry'].delete(0, tk.END)
-            form_fields['end_time_entry'].insert(0, "All Day")
+            form_fields['start_time_var'].set("All Day")
+            form_fields['end_time_var'].set("All Day")
         else:
             # For timed events, set the actual times
-            form_fields['start_time_entry'].delete(0, tk.END)
-            form_fields['start_time_entry'].insert(0, existing_event.start_time)
-            form_fields['end_time_entry'].delete(0, tk.END)
-            form_fields['end_time_entry'].insert(0, existing_event.end_time)
+            form_fields['start_time_entry'].config(state='readonly')
+            form_fields['end_time_entry'].config(state='readonly')
+            form_fields['start_time_var'].set(existing_event.start_time)
+            form_fields['end_time_var'].set(existing_event.end_time)
 
-        form_fields['description_text'].insert("1.0", existing_event.description)
+        form_fields['description_text'].replace("1.0", tk.END, existing_event.description)
         
         # Update character counter after inserting description
         if 'update_char_count' in form_fields:
@@ -457,53 +832,76 @@ class DayViewGUI:
         if existing_event.is_recurring and existing_event.recurrence_pattern:
             recurrence_var.set(existing_event.recurrence_pattern)
             self.toggle_recurrence_options(True, recurrence_frame)
+        else:
+            recurrence_var.set("weekly")
+            self.toggle_recurrence_options(False, recurrence_frame)
 
-    def create_form_buttons(self, dialog, form_fields, recurrence_var, event_index):
+    def create_form_buttons(self, dialog):
         """
         Create the save and cancel buttons for the form.
 
+        The buttons call bound methods that read the form from self, so the
+        reused dialog needs no per-open closures.
+
         Args:
             dialog (tk.Toplevel): The dialog window
-            form_fields (dict): Dictionary containing all form field widgets
-            recurrence_var (tk.StringVar): Recurrence pattern variable
-            event_index (int, optional): Index of event to edit (None for new event)
         """
         button_frame = tk.Frame(dialog)
         button_frame.pack(fill="x", padx=20, pady=10)
 
-        tk.Button(
+        self._save_button = tk.Button(
             button_frame, text="Save Event",
-            command=lambda: self.save_event_data(form_fields, recurrence_var, event_index, dialog),
+            command=self._save_form,
             font=self.NORMAL_FONT, bg="lightgreen"
-        ).pack(side="left", padx=self.BUTTON_PADDING)
+        )
+        self._save_button.pack(side="left", padx=self.BUTTON_PADDING)
 
         tk.Button(
             button_frame, text="Cancel",
-            command=dialog.destroy,
+            command=self._cancel_form,
             font=self.NORMAL_FONT
         ).pack(side="right", padx=self.BUTTON_PADDING)
 
+    def _save_form(self):
+        """Save the event currently shown in the form dialog."""
+        self.save_event_data(self._form_fields, self._recurrence_var, self._form_event, self._form_dialog)
+
+    def _cancel_form(self):
+        """Close the form dialog without saving."""
+        self._hide_form_dialog(self._form_dialog)
+
     def _extract_form_data(self, form_fields, recurrence_var):
         """Extract data from form widgets into a dictionary."""
+        # Read the checkbox once; each get() is a round trip to Tcl
+        is_recurring = form_fields['recurring_var'].get()
         return {
-            'title': form_fields['title_entry'].get().strip(),
+            'title': form_fields['title_var'].get().strip(),
             'start_date': form_fields['start_date_entry'].get_date(),
             'end_date': form_fields['end_date_entry'].get_date(),
-            'start_time': form_fields['start_time_entry'].get().strip(),
-            'end_time': form_fields['end_time_entry'].get().strip(),
+            'start_time': form_fields['start_time_var'].get().strip(),
+            'end_time': form_fields['end_time_var'].get().strip(),
             'description': form_fields['description_text'].get("1.0", tk.END).strip(),
             'is_all_day': form_fields['all_day_var'].get(),
-            'is_recurring': form_fields['recurring_var'].get(),
-            'recurrence_pattern': recurrence_var.get() if form_fields['recurring_var'].get() else None
+            'is_recurring': is_recurring,
+            'recurrence_pattern': recurrence_var.get() if is_recurring else None
         }
 
-    def save_event_data(self, form_fields, recurrence_var, event_index, dialog):
+    def save_event_data(self, form_fields, recurrence_var, selected_event, dialog):
         """Save the event (add new or update existing) using calendar."""
         form_data = self._extract_form_data(form_fields, recurrence_var)
 
-        if event_index is not None:
-            selected_event = self.current_events[event_index]
-            success, message = self.day_service.update_event(
+        refresh_parent = True
+        if selected_event is not None:
+            # Fields that decide which days an event appears on in the parent view
+            before = (selected_event.start_day, selected_event.end_day, bool(selected_event.is_all_day),
+                      bool(selected_event.is_recurring), selected_event.recurrence_pattern or None)
+            after = (form_data['start_date'].isoformat(), form_data['end_date'].isoformat(),
+                     bool(form_data['is_all_day']), bool(form_data['is_recurring']),
+                     form_data['recurrence_pattern'] or None)
+            # A view that only counts events per day looks the same after e.g. a title fix
+            refresh_parent = before != after or self.parent_gui is None or self.parent_gui.SHOWS_EVENT_DETAILS
+            save = functools.partial(
+                self.day_service.update_event,
                 selected_event.event_id,
                 title=form_data['title'],
                 date=form_data['start_date'],
@@ -516,46 +914,138 @@ class DayViewGUI:
                 end_date=form_data['end_date']
             )
         else:
-            success, message, event_id = self.day_service.create_event(
+            save = functools.partial(
+                self.day_service.create_event,
                 form_data['title'], form_data['start_date'], form_data['start_time'], form_data['end_time'],
                 form_data['description'], form_data['is_all_day'], form_data['is_recurring'], form_data['recurrence_pattern'],
                 form_data['end_date']
             )
 
+        # Save on the worker pool; the button stays disabled so the event can't be saved twice
+        self._save_button.config(state='disabled')
+        self._run_in_background(save, lambda future: self._on_save_done(future, dialog, refresh_parent))
+
+    def _on_save_done(self, future, dialog, refresh_parent):
+        """Report the result of a background save and refresh the views."""
+        self._save_button.config(state='normal')
+        # create_event also returns the new id, which isn't needed here
+        success, message = future.result()[:2]
+
         if success:
-            dialog.destroy()
-            self.refresh_events_list()
-            if self.parent_gui:
-                self.parent_gui.refresh_calendar_display()
-            tk.messagebox.showinfo("Success", message)
+            self._hide_form_dialog(dialog)
+            self._schedule_refresh(refresh_parent)
+            messagebox.showinfo("Success", message)
         else:
-            tk.messagebox.showerror("Error", message)
+            messagebox.showerror("Error", message)
 
-    def toggle_time_fields(self, all_day_var, start_time_entry, end_time_entry):
+    def toggle_time_fields(self, all_day_var, start_time_entry, end_time_entry, start_time_var, end_time_var):
         """Enable or disable time fields based on all-day status."""
         if all_day_var.get():
             start_time_entry.config(state='disabled')
             end_time_entry.config(state='disabled')
-            start_time_entry.set("All Day")
-            end_time_entry.set("All Day")
+            start_time_var.set("All Day")
+            end_time_var.set("All Day")
         else:
             start_time_entry.config(state='readonly')
             end_time_entry.config(state='readonly')
-            start_time_entry.set(self.DEFAULT_START_TIME)
-            end_time_entry.set(self.DEFAULT_END_TIME)
+            start_time_var.set(self.DEFAULT_START_TIME)
+            end_time_var.set(self.DEFAULT_END_TIME)
+
+    def _build_confirm_dialog(self):
+        """Build the hidden Yes/No/Cancel window used by _ask_confirmation."""
+        dialog = tk.Toplevel(self.window)
+        dialog.withdraw()
+        dialog.resizable(False, False)
+        dialog.transient(self.window)
+
+        # 1 = Yes, 0 = No, -1 = Cancel (closing the window also counts as Cancel)
+        self._confirm_var = tk.IntVar()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._confirm_var.set(-1))
+        # Stop waiting as well if the day view is closed while the question is shown
+        dialog.bind("<Destroy>", self._on_confirm_dialog_destroyed)
+        # Like messagebox: Return picks the default Yes button, Escape answers No/Cancel
+        dialog.bind("<Return>", lambda event: self._confirm_yes_button.invoke())
+        dialog.bind("<Escape>", lambda event: self._confirm_var.set(-1))
+
+        self._confirm_label = tk.Label(dialog, font=self.NORMAL_FONT, justify="left", wraplength=360)
+        self._confirm_label.pack(padx=self.FRAME_PADDING * 2, pady=self.FRAME_PADDING * 2)
+
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=(0, self.FRAME_PADDING))
+        self._confirm_yes_button = tk.Button(button_frame, text="Yes", width=8, font=self.NORMAL_FONT,
+                                             default="active", command=lambda: self._confirm_var.set(1))
+        self._confirm_yes_button.pack(side="left", padx=self.BUTTON_PADDING)
+        tk.Button(button_frame, text="No", width=8, font=self.NORMAL_FONT,
+                  command=lambda: self._confirm_var.set(0)).pack(side="left", padx=self.BUTTON_PADDING)
+        self._confirm_cancel_button = tk.Button(button_frame, text="Cancel", width=8, font=self.NORMAL_FONT,
+                                                command=lambda: self._confirm_var.set(-1))
+        self._confirm_cancel_button.pack(side="left", padx=self.BUTTON_PADDING)
+
+        self._confirm_dialog = dialog
+
+    def _on_confirm_dialog_destroyed(self, event):
+        """Answer Cancel when the confirmation window itself (not one of its widgets) is destroyed."""
+        if event.widget is self._confirm_dialog:
+            self._confirm_var.set(-1)
+
+    def _ask_confirmation(self, title, message, allow_cancel=False):
+        """
+        Ask a Yes/No (or Yes/No/Cancel) question in a reused confirmation window.
+        Works like messagebox.askyesno/askyesnocancel, without building a new
+        message box for every delete.
+
+        Args:
+            title (str): Title of the confirmation window
+            message (str): Question to show
+            allow_cancel (bool): Whether to offer a Cancel button
+
+        Returns:
+            bool or None: True for Yes, False for No, None for Cancel. Without
+            a Cancel button, closing the window counts as No.
+        """
+        if self._confirm_dialog is None or not self._confirm_dialog.winfo_exists():
+            self._build_confirm_dialog()
+
+        dialog = self._confirm_dialog
+        dialog.title(title)
+        self._confirm_label.config(text=message)
+        if allow_cancel:
+            self._confirm_cancel_button.pack(side="left", padx=self.BUTTON_PADDING)
+        else:
+            self._confirm_cancel_button.pack_forget()
+
+        # Center the window over the day view, as the standard message boxes do
+        dialog.update_idletasks()
+        x = self.window.winfo_rootx() + (self.window.winfo_width() - dialog.winfo_reqwidth()) // 2
+        y = self.window.winfo_rooty() + (self.window.winfo_height() - dialog.winfo_reqheight()) // 2
+        dialog.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+
+        dialog.deiconify()
+        dialog.grab_set()
+        self._confirm_yes_button.focus_set()
+        # Block here (while still handling events) until one of the buttons sets the variable
+        dialog.wait_variable(self._confirm_var)
+        if dialog.winfo_exists():
+            dialog.grab_release()
+            dialog.withdraw()
+
+        answer = self._confirm_var.get()
+        if answer == 1:
+            return True
+        if answer == 0 or not allow_cancel:
+            return False
+        return None
 
     def delete_event(self):
         """Delete the selected event after confirmation."""
-        selection = self.events_listbox.curselection()
-
-        if not selection:
-            tk.messagebox.showwarning("No Selection", "Please select an event to delete.")
+        if self._selected_index is None:
+            messagebox.showwarning("No Selection", "Please select an event to delete.")
             return
 
-        selected_index = selection[0]
+        selected_index = self._selected_index
 
         if not self.current_events or selected_index >= len(self.current_events):
-            tk.messagebox.showwarning("No Event", "No valid event selected to delete.")
+            messagebox.showwarning("No Event", "No valid event selected to delete.")
             return
 
         selected_event = self.current_events[selected_index]
@@ -564,12 +1054,13 @@ class DayViewGUI:
         delete_all = False
         if selected_event.is_recurring:
             # Ask user if they want to delete all instances
-            response = tk.messagebox.askyesnocancel(
+            response = self._ask_confirmation(
                 "Delete Recurring Event",
                 f"'{selected_event.title}' is a recurring event.\n\n"
                 f"Yes = Delete ALL occurrences ({selected_event.recurrence_pattern})\n"
                 f"No = Delete only THIS occurrence\n"
-                f"Cancel = Don't delete"
+                f"Cancel = Don't delete",
+                allow_cancel=True
             )
             
             if response is None:  # Cancel
@@ -577,19 +1068,26 @@ class DayViewGUI:
             delete_all = response  # True = delete all, False = delete single
         else:
             # Regular event confirmation
-            confirm = tk.messagebox.askyesno(
+            confirm = self._ask_confirmation(
                 "Confirm Delete",
                 f"Are you sure you want to delete the event '{selected_event.title}'?"
             )
             if not confirm:
                 return
 
-        success, message = self.day_service.delete_event(selected_event.event_id, delete_all_recurring=delete_all)
+        self._delete_button.config(state='disabled')
+        self._run_in_background(
+            functools.partial(self.day_service.delete_event, selected_event.event_id, delete_all_recurring=delete_all),
+            self._on_delete_done
+        )
+
+    def _on_delete_done(self, future):
+        """Report the result of a background delete and refresh the views."""
+        self._delete_button.config(state='normal')
+        success, message = future.result()
 
         if success:
-            self.refresh_events_list()
-            if self.parent_gui:
-                self.parent_gui.refresh_calendar_display()
-            tk.messagebox.showinfo("Success", message)
+            self._schedule_refresh()
+            messagebox.showinfo("Success", message)
         else:
-            tk.messagebox.showerror("Error", message)
+            messagebox.showerror("Error", message)
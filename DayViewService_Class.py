@@ -30,6 +30,8 @@ class DayViewService:
         self.calendar_service = calendar_service
         self.DATE_FORMAT = "%d-%m-%Y"  # DD-MM-YYYY (16-11-2025)
         self.DATABASE_DATE_FORMAT = "%Y-%m-%d"  # Database internal format (YYYY-MM-DD)
+        # Maps date string to (database generation, Event list) from the last lookup
+        self._events_cache = {}
     
     def format_date_for_display(self, date: datetime.date) -> str:
         """
@@ -46,6 +48,8 @@ class DayViewService:
     def get_events_for_date(self, date):
         """
         Get all events for a specific date.
+        The Event objects are kept and reused until the database is written
+        to, so refreshing an unchanged day doesn't rebuild them.
 
         Args:
             date (datetime.date): The date to get events for
@@ -53,9 +57,20 @@ class DayViewService:
         Returns:
             List[Event]: All events on that date
         """
-        date_str = date.strftime(self.DATABASE_DATE_FORMAT)
-        event_dicts = self.calendar_service.repository.get_events_for_date(date_str)
-        return [self.calendar_service._dict_to_event(event_dict) for event_dict in event_dicts]
+        # isoformat() is the YYYY-MM-DD database format, built without going through strftime
+        date_str = date.isoformat()
+        repository = self.calendar_service.repository
+        # Read the generation before querying, so a write during the query makes the entry stale
+        generation = repository.generation
+
+        cached = self._events_cache.get(date_str)
+        if cached is not None and cached[0] == generation:
+            return list(cached[1])
+
+        event_dicts = repository.get_events_for_date(date_str)
+        events = [self.calendar_service._dict_to_event(event_dict) for event_dict in event_dicts]
+        self._events_cache[date_str] = (generation, events)
+        return list(events)
     
     def create_event(self,
                      title,
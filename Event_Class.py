@@ -1,3 +1,12 @@
+import datetime
+import functools
+import sys
+
+
+# Shared by every event: events on the same day reuse one parsed date object
+_parse_day = functools.lru_cache(maxsize=1024)(datetime.date.fromisoformat)
+
+
 class Event(object):
     """
     Represents a calendar event with all its properties.
@@ -9,6 +18,8 @@ class Event(object):
         date (str): The primary date of the event in YYYY-MM-DD format
         start_day (str): The starting date of the event in YYYY-MM-DD format
         end_day (str): The ending date of the event in YYYY-MM-DD format
+        start_date (datetime.date): start_day as a date object (read-only)
+        end_date (datetime.date): end_day as a date object (read-only)
         start_time (str): The start time of the event
         end_time (str): The end time of the event
         description (str): Detailed description of the event
@@ -16,6 +27,10 @@ class Event(object):
         recurrence_pattern (str): How often the event repeats (daily, weekly, monthly, yearly)
         is_all_day (bool): Whether the event is an all-day event
     """
+    # Events are created for every row of every query, so avoid a per-instance __dict__
+    __slots__ = ('_event_id', '_title', '_date', '_start_day', '_end_day', '_start_time',
+                 '_end_time', '_description', '_is_recurring', '_recurrence_pattern', '_is_all_day')
+
     def __init__(self, event_id, title, date, start_day, end_day, start_time, end_time, description, is_recurring, recurrence_pattern=None, is_all_day=False):
         """
         Initialize an Event object with all necessary properties.
@@ -109,6 +124,17 @@ class Event(object):
         """Set the end day."""
         self._end_day = value
 
+    # Start/end date properties
+    @property
+    def start_date(self):
+        """Get the start day as a datetime.date."""
+        return _parse_day(self._start_day)
+
+    @property
+    def end_date(self):
+        """Get the end day as a datetime.date."""
+        return _parse_day(self._end_day)
+
     # Start time property
     @property
     def start_time(self):
@@ -210,18 +236,20 @@ class Event(object):
                 ...
             })
         """
+        # Intern the date strings so events on the same day share one string object
         return cls(
             event_id=event_dict['event_id'],
             title=event_dict['title'],
-            date=event_dict['date'],
-            start_day=event_dict['start_day'],
-            end_day=event_dict['end_day'],
+            date=sys.intern(event_dict['date']),
+            start_day=sys.intern(event_dict['start_day']),
+            end_day=sys.intern(event_dict['end_day']),
             start_time=event_dict['start_time'],
             end_time=event_dict['end_time'],
             description=event_dict.get('description', ''),
-            is_recurring=event_dict.get('is_recurring', False),
+            # The database stores the flags as 0/1 integers
+            is_recurring=bool(event_dict.get('is_recurring', False)),
             recurrence_pattern=event_dict.get('recurrence_pattern'),
-            is_all_day=event_dict.get('is_all_day', False)
+            is_all_day=bool(event_dict.get('is_all_day', False))
         )
 
     @classmethod
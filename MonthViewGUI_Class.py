@@ -31,6 +31,9 @@ class MonthViewGUI:
         filter_btn (tk.Button): Button to open filter dialog
     """
 
+    # Day cells only show how many events a date has, not their titles or times
+    SHOWS_EVENT_DETAILS = False
+
     def __init__(self, calendar_obj=None):
         """
         Initialize the MonthViewGUI and create the calendar interface.
@@ -244,9 +247,14 @@ class MonthViewGUI:
             col += 1
 
         first_weekday, num_days = calendar.monthrange(year, month)
+        # Load the whole month's events once, grouped by date
+        events_by_date = self.month_service.get_events_by_date(year, month)
         # Adjust so Sunday is column 0
         start_col = (first_weekday + 1) % 7
 
+        # Get today's date from service for highlighting, once for the whole grid
+        today = self.calendar.get_today()
+
         # Fill the entire calendar grid (6 rows x 7 columns)
         row = 1
         day_num = 1
@@ -263,16 +271,15 @@ class MonthViewGUI:
 
                 # Check if we're within the days of the current month
                 elif day_num <= num_days:
-                    # Get today's date from service for highlighting
-                    today = self.calendar.get_today()
-                    if (year, month, day_num) == (today.year, today.month, today.day):
+                    current_date = datetime.date(year, month, day_num)
+                    if current_date == today:
                         fg = "red"
                     else:
                         fg = "black"
 
-                    # Check for events using service
-                    current_date = datetime.date(year, month, day_num)
-                    has_events = self.month_service.has_events_on_date(current_date)
+                    # Check for events using the month's date index
+                    events_on_date = events_by_date.get(current_date, [])
+                    has_events = len(events_on_date) > 0
                     bg_color = "yellow" if has_events else None
                     
                     # Create a frame to hold button content
@@ -291,7 +298,6 @@ class MonthViewGUI:
                     
                     # Add event count in center if there are events
                     if has_events:
-                        events_on_date = self.month_service.get_events_for_date(current_date)
                         event_count = len(events_on_date)
                         event_text = f"({event_count} event{'s' if event_count != 1 else ''})"
                         event_label = tk.Label(day_frame, text=event_text, bg=bg_color, fg="black",
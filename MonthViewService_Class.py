@@ -7,6 +7,7 @@ It includes month navigation, formatting, and event retrieval for month views.
 
 import datetime
 import calendar
+import Calendar_Math
 
 
 class MonthViewService:
@@ -52,10 +53,7 @@ class MonthViewService:
         Returns:
             Tuple[int, int]: (next_year, next_month)
         """
-        if month < 12:
-            return year, month + 1
-        else:
-            return year + 1, 1
+        return Calendar_Math.next_month(year, month)
     
     def calculate_previous_month(self, year, month):
         """
@@ -68,10 +66,7 @@ class MonthViewService:
         Returns:
             Tuple[int, int]: (previous_year, previous_month)
         """
-        if month > 1:
-            return year, month - 1
-        else:
-            return year - 1, 12
+        return Calendar_Math.previous_month(year, month)
     
     def format_month_display_name(self, year, month):
         """
@@ -96,8 +91,8 @@ class MonthViewService:
         Returns:
             bool: True if there are events, False otherwise
         """
-        events = self.get_events_for_date(date)
-        return len(events) > 0
+        date_str = date.strftime(self.DATABASE_DATE_FORMAT)
+        return self.calendar_service.repository.has_events_on_date(date_str)
     
     def get_events_for_month(self, year, month):
         """
@@ -113,6 +108,26 @@ class MonthViewService:
         event_dicts = self.calendar_service.repository.get_events_for_month(year, month)
         return [self.calendar_service._dict_to_event(event_dict) for event_dict in event_dicts]
     
+    def get_events_by_date(self, year, month):
+        """
+        Get all events for a month grouped by the dates they occur on.
+        Uses a single month query instead of one query per day, so the month
+        grid can be drawn with dictionary lookups.
+
+        Args:
+            year (int): Year (e.g., 2025)
+            month (int): Month (1-12)
+
+        Returns:
+            dict: Maps datetime.date to the list of Event objects on that date.
+                  Multi-day events are listed under every day they cover in the month.
+        """
+        first_day = datetime.date(year, month, 1)
+        last_day = datetime.date(year, month, Calendar_Math.days_in_month(year, month))
+
+        month_events = self.get_events_for_month(year, month)
+        return self.calendar_service.group_events_by_date(month_events, first_day, last_day)
+    
     def get_events_for_date(self, date):
         """
         Get all events for a specific date.
@@ -139,28 +154,4 @@ class MonthViewService:
         Returns:
             list: List of all Event objects sorted by date and time
         """
-        all_events = []
-        today = self.calendar_service.get_today()
-
-        # Get events from specified range
-        for month_offset in range(-months_before, months_after + 1):
-            # Calculate target month/year
-            target_year = today.year
-            target_month = today.month + month_offset
-
-            # Adjust for year boundaries
-            while target_month <= 0:
-                target_month += 12
-                target_year -= 1
-            while target_month > 12:
-                target_month -= 12
-                target_year += 1
-
-            # Get events for this month
-            month_events = self.get_events_for_month(target_year, target_month)
-            all_events.extend(month_events)
-
-        # Sort events by date and time
-        all_events.sort(key=lambda event: (event.date, event.start_time))
-
-        return all_events
+        return self.calendar_service.get_events_around_today(months_before, months_after)
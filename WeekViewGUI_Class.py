@@ -23,6 +23,9 @@ class WeekViewGUI:
         parent_gui (MonthViewGUI): Reference to parent month view for data consistency
     """
 
+    # Day buttons only show how many events a date has, not their titles or times
+    SHOWS_EVENT_DETAILS = False
+
     def __init__(self, calendar_obj, year, month, day, parent_gui=None):
         """
         Initialize the WeekViewGUI for a specific date's week.
@@ -142,6 +145,9 @@ class WeekViewGUI:
             day_header = tk.Label(self.frame, text=days_of_the_week[col], font=("Arial", 12, "bold"))
             day_header.grid(row=0, column=col, padx=2, pady=2)
 
+        # Load the whole week's events once, grouped by date
+        events_by_date = self.week_service.get_events_by_date(self.current_week_start)
+
         # Create day buttons for the week
         for col in range(7):
             current_date = self.current_week_start + datetime.timedelta(days=col)
@@ -152,8 +158,9 @@ class WeekViewGUI:
             else:
                 fg = "black"
 
-            # Check for events using the new calendar system
-            has_events = self.week_service.has_events_on_date(current_date)
+            # Check for events using the week's date index
+            events_on_date = events_by_date.get(current_date, [])
+            has_events = len(events_on_date) > 0
             bg_color = "yellow" if has_events else None
 
             # Create button text with date and day
@@ -161,7 +168,6 @@ class WeekViewGUI:
 
             # Add event count if there are events
             if has_events:
-                events_on_date = self.week_service.get_events_for_date(current_date)
                 event_count = len(events_on_date)
                 button_text += f"\n({event_count} event{'s' if event_count != 1 else ''})"
 
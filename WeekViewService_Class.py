@@ -5,7 +5,36 @@ This service handles all week-specific calendar operations for the WeekViewGUI.
 It includes week navigation, formatting, and event retrieval for week views.
 """
 
+import calendar
 import datetime
+import functools
+import Calendar_Math
+
+
+# Month names looked up once instead of through calendar.month_name on every call
+_MONTH_NAMES = tuple(calendar.month_name)
+
+
+@functools.lru_cache(maxsize=512)
+def _format_week_range(week_start, week_end):
+    """
+    Build the week range text for format_week_display_name.
+    Cached because the week header is redrawn for the same weeks repeatedly.
+
+    Args:
+        week_start (datetime.date): Start of week (Sunday)
+        week_end (datetime.date): End of week (Saturday)
+
+    Returns:
+        str: Formatted week range
+    """
+    if week_start.year == week_end.year:
+        if week_start.month == week_end.month:
+            return "%s %d-%d, %d" % (_MONTH_NAMES[week_start.month], week_start.day, week_end.day, week_start.year)
+        return "%s %d - %s %d, %d" % (_MONTH_NAMES[week_start.month], week_start.day,
+                                      _MONTH_NAMES[week_end.month], week_end.day, week_start.year)
+    return "%s %d, %d - %s %d, %d" % (_MONTH_NAMES[week_start.month], week_start.day, week_start.year,
+                                      _MONTH_NAMES[week_end.month], week_end.day, week_end.year)
 
 
 class WeekViewService:
@@ -40,8 +69,7 @@ class WeekViewService:
         Returns:
             datetime.date: The Sunday that starts the week containing the given date
         """
-        days_since_sunday = (date.weekday() + 1) % 7
-        return date - datetime.timedelta(days=days_since_sunday)
+        return datetime.date.fromordinal(Calendar_Math.week_start_ordinal(date.toordinal()))
     
     def calculate_week_dates(self, week_start):
         """
@@ -53,7 +81,8 @@ class WeekViewService:
         Returns:
             List[datetime.date]: List of 7 dates for the week
         """
-        return [week_start + datetime.timedelta(days=i) for i in range(7)]
+        start_ordinal = week_start.toordinal()
+        return [datetime.date.fromordinal(ordinal) for ordinal in range(start_ordinal, start_ordinal + 7)]
     
     def format_week_display_name(self, week_start, week_end):
         """
@@ -66,15 +95,7 @@ class WeekViewService:
         Returns:
             str: Formatted week range
         """
-        import calendar
-        
-        if week_start.year == week_end.year:
-            if week_start.month == week_end.month:
-                return f"{calendar.month_name[week_start.month]} {week_start.day}-{week_end.day}, {week_start.year}"
-            else:
-                return f"{calendar.month_name[week_start.month]} {week_start.day} - {calendar.month_name[week_end.month]} {week_end.day}, {week_start.year}"
-        else:
-            return f"{calendar.month_name[week_start.month]} {week_start.day}, {week_start.year} - {calendar.month_name[week_end.month]} {week_end.day}, {week_end.year}"
+        return _format_week_range(week_start, week_end)
     
     def has_events_on_date(self, date: datetime.date) -> bool:
         """
@@ -86,8 +107,27 @@ class WeekViewService:
         Returns:
             bool: True if there are events, False otherwise
         """
-        events = self.get_events_for_date(date)
-        return len(events) > 0
+        date_str = date.strftime(self.DATABASE_DATE_FORMAT)
+        return self.calendar_service.repository.has_events_on_date(date_str)
+    
+    def get_events_by_date(self, week_start):
+        """
+        Get all events for a week grouped by the dates they occur on.
+        Uses a single range query instead of one query per day.
+
+        Args:
+            week_start (datetime.date): The Sunday that starts the week
+
+        Returns:
+            dict: Maps datetime.date to the list of Event objects on that date
+        """
+        week_end = week_start + datetime.timedelta(days=6)
+        event_dicts = self.calendar_service.repository.get_events_for_date_range(
+            week_start.strftime(self.DATABASE_DATE_FORMAT),
+            week_end.strftime(self.DATABASE_DATE_FORMAT)
+        )
+        week_events = [self.calendar_service._dict_to_event(event_dict) for event_dict in event_dicts]
+        return self.calendar_service.group_events_by_date(week_events, week_start, week_end)
     
     def get_events_for_date(self, date):
         """
@@ -64,6 +64,26 @@ class TestAgendaViewService(unittest.TestCase):
         
         self.assertIsInstance(events, list)
 
+    def test_get_all_events_lists_multi_month_event_once(self):
+        """Test that an event spanning two months appears only once"""
+        today = datetime.date.today()
+        # Last day of next month, ending in the month after
+        next_month_start = (today.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+        start_date = (next_month_start + datetime.timedelta(days=32)).replace(day=1) - datetime.timedelta(days=1)
+        end_date = start_date + datetime.timedelta(days=2)
+
+        success, message, event_id = self.calendar_service.create_event(
+            title="Month Boundary Trip",
+            date=start_date,
+            is_all_day=True,
+            end_date=end_date
+        )
+        self.assertTrue(success)
+
+        events = self.agenda_service.get_all_events()
+        matching = [event for event in events if event.event_id == event_id]
+        self.assertEqual(len(matching), 1)
+
     def test_get_event_by_id(self):
         """Test getting a specific event by ID"""
         # Get all events
@@ -10,6 +10,7 @@ import datetime
 # Import the classes we need to test
 from CalendarService import CalendarService
 from Calendar_Database_Class import CalendarDatabase
+from Event_Class import Event
 
 
 class TestCalendarService(unittest.TestCase):
@@ -69,6 +70,21 @@ class TestCalendarService(unittest.TestCase):
         self.assertIn("title", message.lower())
         self.assertIsNone(event_id)
 
+    def test_create_event_with_blank_title(self):
+        """Test that a whitespace-only title is treated as empty"""
+        future_date = datetime.date.today() + datetime.timedelta(days=1)
+
+        success, message, event_id = self.service.create_event(
+            title="   \t",
+            date=future_date,
+            start_time="10:00 AM",
+            end_time="11:00 AM"
+        )
+
+        self.assertFalse(success)
+        self.assertIn("title", message.lower())
+        self.assertIsNone(event_id)
+
     def test_create_event_past_date(self):
         """Test that creating event in the past fails"""
         past_date = datetime.date.today() - datetime.timedelta(days=1)
@@ -154,6 +170,180 @@ class TestCalendarService(unittest.TestCase):
         self.assertIn("recurring", message.lower())
         self.assertIsNotNone(event_id)
 
+    def test_create_recurring_event_saves_all_instances(self):
+        """Test that every occurrence of a recurring event is saved"""
+        future_date = datetime.date.today() + datetime.timedelta(days=1)
+
+        success, message, event_id = self.service.create_event(
+            title="Daily Series",
+            date=future_date,
+            start_time="08:00 AM",
+            end_time="08:30 AM",
+            is_recurring=True,
+            recurrence_pattern="daily"
+        )
+
+        self.assertTrue(success)
+        self.assertIn("30 instances", message)
+        first_event = self.db.get_event_by_id(event_id)
+        self.assertEqual(first_event['date'], future_date.strftime("%Y-%m-%d"))
+        self.assertTrue(first_event['is_recurring'])
+
+    def test_get_events_around_today(self):
+        """Test that the month window includes near events and excludes far ones"""
+        near_date = datetime.date.today() + datetime.timedelta(days=20)
+        far_date = datetime.date.today() + datetime.timedelta(days=400)
+        _, _, near_id = self.service.create_event(
+            title="Near Event", date=near_date, start_time="10:00 AM", end_time="11:00 AM"
+        )
+        _, _, far_id = self.service.create_event(
+            title="Far Event", date=far_date, start_time="10:00 AM", end_time="11:00 AM"
+        )
+
+        event_ids = [event.event_id for event in self.service.get_events_around_today()]
+
+        self.assertIn(near_id, event_ids)
+        self.assertNotIn(far_id, event_ids)
+
+    def test_import_events(self):
+        """Test importing a batch of events in one call"""
+        future_date = datetime.date.today() + datetime.timedelta(days=9)
+        events = [
+            Event.create_new(title=f"Imported {i}", date=future_date.strftime("%Y-%m-%d"),
+                             start_time="10:00 AM", end_time="11:00 AM")
+            for i in range(3)
+        ]
+
+        success, message, event_ids = self.service.import_events(events)
+
+        self.assertTrue(success)
+        self.assertEqual(len(event_ids), 3)
+        for i, event_id in enumerate(event_ids):
+            self.assertEqual(self.db.get_event_by_id(event_id)['title'], f"Imported {i}")
+
+    def test_import_events_across_batches(self):
+        """Test that ids stay matched to events when the insert is split into batches"""
+        self.db.INSERT_BATCH_SIZE = 2
+        future_date = datetime.date.today() + datetime.timedelta(days=9)
+        events = [
+            Event.create_new(title=f"Batched {i}", date=future_date.strftime("%Y-%m-%d"),
+                             start_time="10:00 AM", end_time="11:00 AM")
+            for i in range(5)
+        ]
+
+        success, message, event_ids = self.service.import_events(events)
+
+        self.assertTrue(success)
+        self.assertEqual(len(set(event_ids)), 5)
+        for i, event_id in enumerate(event_ids):
+            self.assertEqual(self.db.get_event_by_id(event_id)['title'], f"Batched {i}")
+
+    def test_update_events_bulk(self):
+        """Test updating several events with one merged statement"""
+        self.db.UPDATE_BATCH_SIZE = 2
+        future_date = datetime.date.today() + datetime.timedelta(days=9)
+        events = [
+            Event.create_new(title=f"Before {i}", date=future_date.strftime("%Y-%m-%d"),
+                             start_time="10:00 AM", end_time="11:00 AM")
+            for i in range(3)
+        ]
+        _, _, event_ids = self.service.import_events(events)
+
+        updates = []
+        for i, event_id in enumerate(event_ids):
+            event_dict = self.db.get_event_by_id(event_id)
+            event_dict['title'] = f"After {i}"
+            updates.append(event_dict)
+
+        self.assertEqual(self.db.update_events_bulk(updates), 3)
+        for i, event_id in enumerate(event_ids):
+            event_dict = self.db.get_event_by_id(event_id)
+            self.assertEqual(event_dict['title'], f"After {i}")
+            self.assertEqual(event_dict['start_time'], "10:00 AM")
+
+    def test_save_events_updates_and_inserts(self):
+        """Test saving a mix of existing and new events in one call"""
+        future_date = datetime.date.today() + datetime.timedelta(days=9)
+        date_str = future_date.strftime("%Y-%m-%d")
+        _, _, event_id = self.service.create_event(
+            title="Existing", date=future_date, start_time="10:00 AM", end_time="11:00 AM"
+        )
+        existing = self.service._dict_to_event(self.db.get_event_by_id(event_id))
+        existing.title = "Existing Renamed"
+        new_event = Event.create_new(title="Brand New", date=date_str,
+                                     start_time="01:00 PM", end_time="02:00 PM")
+
+        success, message, event_ids = self.service.save_events([existing, new_event])
+
+        self.assertTrue(success)
+        self.assertEqual(event_ids[0], event_id)
+        self.assertEqual(self.db.get_event_by_id(event_id)['title'], "Existing Renamed")
+        self.assertEqual(self.db.get_event_by_id(event_ids[1])['title'], "Brand New")
+
+    def test_save_events_with_missing_id_saves_nothing(self):
+        """Test that a batch with an unknown event_id leaves every event unchanged"""
+        future_date = datetime.date.today() + datetime.timedelta(days=9)
+        date_str = future_date.strftime("%Y-%m-%d")
+        _, _, event_id = self.service.create_event(
+            title="Untouched", date=future_date, start_time="10:00 AM", end_time="11:00 AM"
+        )
+        existing = self.service._dict_to_event(self.db.get_event_by_id(event_id))
+        existing.title = "Should Not Save"
+        missing = self.service._dict_to_event(self.db.get_event_by_id(event_id))
+        missing.event_id = 10 ** 9
+        new_event = Event.create_new(title="Rolled Back Insert", date=date_str,
+                                     start_time="01:00 PM", end_time="02:00 PM")
+
+        success, message, event_ids = self.service.save_events([existing, missing, new_event])
+
+        self.assertFalse(success)
+        self.assertEqual(event_ids, [])
+        self.assertEqual(self.db.get_event_by_id(event_id)['title'], "Untouched")
+        titles = [event['title'] for event in self.db.get_events_for_date(date_str)]
+        self.assertNotIn("Rolled Back Insert", titles)
+
+    def test_delete_events(self):
+        """Test deleting several events with one merged statement"""
+        future_date = datetime.date.today() + datetime.timedelta(days=9)
+        events = [
+            Event.create_new(title=f"Doomed {i}", date=future_date.strftime("%Y-%m-%d"),
+                             start_time="10:00 AM", end_time="11:00 AM")
+            for i in range(3)
+        ]
+        _, _, event_ids = self.service.import_events(events)
+
+        self.assertEqual(self.db.delete_events(event_ids[:2]), 2)
+        self.assertIsNone(self.db.get_event_by_id(event_ids[0]))
+        self.assertIsNone(self.db.get_event_by_id(event_ids[1]))
+        self.assertIsNotNone(self.db.get_event_by_id(event_ids[2]))
+        self.assertEqual(self.db.delete_events([]), 0)
+
+    def test_cached_date_query_sees_new_events(self):
+        """Test that a repeated date query reflects events added in between"""
+        future_date = datetime.date.today() + datetime.timedelta(days=11)
+        date_str = future_date.strftime("%Y-%m-%d")
+        before = len(self.db.get_events_for_date(date_str))
+
+        self.service.create_event(
+            title="Cache Check", date=future_date, start_time="10:00 AM", end_time="11:00 AM"
+        )
+
+        self.assertEqual(len(self.db.get_events_for_date(date_str)), before + 1)
+
+    def test_in_memory_database_keeps_data_between_calls(self):
+        """Test that an in-memory database keeps its events until closed"""
+        memory_db = CalendarDatabase(":memory:")
+        memory_service = CalendarService(memory_db)
+        future_date = datetime.date.today() + datetime.timedelta(days=2)
+
+        success, message, event_id = memory_service.create_event(
+            title="Memory Event", date=future_date, start_time="10:00 AM", end_time="11:00 AM"
+        )
+
+        self.assertTrue(success)
+        self.assertEqual(memory_db.get_event_by_id(event_id)['title'], "Memory Event")
+        memory_db.close()
+
     def test_description_length_validation(self):
         """Test that description over 80 characters is rejected"""
         future_date = datetime.date.today() + datetime.timedelta(days=1)
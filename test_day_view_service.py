@@ -67,6 +67,25 @@ class TestDayViewService(unittest.TestCase):
         self.assertEqual(len(events), 1)
         self.assertEqual(events[0].title, "Day Test Event")
 
+    def test_get_events_for_date_sees_changes(self):
+        """Test that repeated lookups pick up edits made through any service"""
+        future_date = datetime.date.today() + datetime.timedelta(days=13)
+        _, _, event_id = self.day_service.create_event(
+            title="Before Rename",
+            date=future_date,
+            start_time="01:00 PM",
+            end_time="02:00 PM"
+        )
+        titles = [event.title for event in self.day_service.get_events_for_date(future_date)]
+        self.assertIn("Before Rename", titles)
+
+        # Edit through the calendar service, not the day service
+        self.calendar_service.update_event(event_id, title="After Rename")
+
+        titles = [event.title for event in self.day_service.get_events_for_date(future_date)]
+        self.assertIn("After Rename", titles)
+        self.assertNotIn("Before Rename", titles)
+
     def test_create_event_through_day_service(self):
         """Test creating event through DayViewService"""
         future_date = datetime.date.today() + datetime.timedelta(days=7)
@@ -99,6 +99,33 @@ class TestMonthViewService(unittest.TestCase):
         self.assertEqual(len(events), 1)
         self.assertEqual(events[0].title, "Test Event")
 
+    def test_get_events_by_date(self):
+        """Test grouping a month's events by date"""
+        future_date = datetime.date.today() + datetime.timedelta(days=5)
+        events_by_date = self.month_service.get_events_by_date(future_date.year, future_date.month)
+
+        self.assertIsInstance(events_by_date, dict)
+        self.assertIn(future_date, events_by_date)
+        titles = [event.title for event in events_by_date[future_date]]
+        self.assertIn("Test Event", titles)
+
+    def test_get_events_by_date_multi_day_event(self):
+        """Test that multi-day events are listed under every day they cover"""
+        start_date = datetime.date.today() + datetime.timedelta(days=40)
+        end_date = start_date + datetime.timedelta(days=2)
+        self.calendar_service.create_event(
+            title="Conference",
+            date=start_date,
+            is_all_day=True,
+            end_date=end_date
+        )
+
+        for offset in range(3):
+            day = start_date + datetime.timedelta(days=offset)
+            events_by_date = self.month_service.get_events_by_date(day.year, day.month)
+            titles = [event.title for event in events_by_date.get(day, [])]
+            self.assertIn("Conference", titles)
+
     def test_get_events_for_all_months(self):
         """Test getting events across multiple months"""
         events = self.month_service.get_events_for_all_months()
@@ -45,6 +45,13 @@ class TestWeekViewService(unittest.TestCase):
         
         self.assertEqual(week_start, test_date)
 
+    def test_calculate_week_start_for_saturday(self):
+        """Test that Saturday returns the Sunday six days earlier"""
+        test_date = datetime.date(2026, 1, 3)  # Saturday
+        week_start = self.week_service.calculate_week_start(test_date)
+
+        self.assertEqual(week_start, datetime.date(2025, 12, 28))
+
     def test_calculate_week_dates(self):
         """Test calculating all 7 dates in a week"""
         week_start = datetime.date(2025, 11, 16)  # Sunday
@@ -76,6 +83,15 @@ class TestWeekViewService(unittest.TestCase):
         self.assertIn("November", result)
         self.assertIn("December", result)
 
+    def test_format_week_display_name_cross_year(self):
+        """Test formatting week display name across years"""
+        week_start = datetime.date(2025, 12, 28)  # Sunday in December
+        week_end = datetime.date(2026, 1, 3)      # Saturday in January
+
+        result = self.week_service.format_week_display_name(week_start, week_end)
+
+        self.assertEqual(result, "December 28, 2025 - January 3, 2026")
+
     def test_has_events_on_date(self):
         """Test checking if date has events"""
         # Create an event
@@ -94,6 +110,25 @@ class TestWeekViewService(unittest.TestCase):
         other_date = datetime.date.today() + datetime.timedelta(days=100)
         self.assertFalse(self.week_service.has_events_on_date(other_date))
 
+    def test_get_events_by_date(self):
+        """Test grouping a week's events by date"""
+        future_date = datetime.date.today() + datetime.timedelta(days=12)
+        self.calendar_service.create_event(
+            title="Weekly Planning",
+            date=future_date,
+            start_time="09:00 AM",
+            end_time="10:00 AM"
+        )
+
+        week_start = self.week_service.calculate_week_start(future_date)
+        events_by_date = self.week_service.get_events_by_date(week_start)
+
+        self.assertIn(future_date, events_by_date)
+        titles = [event.title for event in events_by_date[future_date]]
+        self.assertIn("Weekly Planning", titles)
+        for date in events_by_date:
+            self.assertTrue(week_start <= date <= week_start + datetime.timedelta(days=6))
+
     def test_get_events_for_date(self):
         """Test getting events for a specific date"""
         future_date = datetime.date.today() + datetime.timedelta(days=8)